@@ -1,11 +1,190 @@
 import random
+import sys
 import uuid
 import json
+import multiprocessing
+from bisect import bisect
+from itertools import accumulate
 from datetime import datetime, timezone, timedelta
 from gameday import GamedayData, GameData, LiveData, Linescore, InningLinescore, Play, PlayResult, PlayAbout, PlayCount, PlayEvent, Runner, FielderCredit, PitchData, HitData, PitchDetails, Boxscore, BoxscoreTeam, BoxscorePlayer
 from teams import TEAMS
 from commentary import GAME_CONTEXT
 
+# Fielder/out-type groupings used on the batted-ball hot path.
+_OUTFIELD_POSITIONS = frozenset(('LF', 'CF', 'RF'))
+# Fielder lists are built in this order; fielder selection weights follow it
+_INFIELD_ORDER = ('1B', '2B', '3B', 'SS')
+_OUTFIELD_ORDER = ('LF', 'CF', 'RF')
+_INFIELD_OUT_TYPES = frozenset(('Groundout', 'Sacrifice Bunt', 'Lineout', 'Pop Out', 'Forceout', 'Grounded Into DP', 'Double Play'))
+_AIR_OUT_TYPES = frozenset(('Flyout', 'Pop Out', 'Lineout'))
+_GROUND_OUT_TYPES = frozenset(('Groundout', 'Grounded Into DP', 'Double Play'))
+_DOUBLE_PLAY_TYPES = frozenset(('Grounded Into DP', 'Double Play'))
+_HIT_TYPES = frozenset(('Single', 'Double', 'Triple', 'Home Run'))
+_WALK_TYPES = frozenset(('Walk', 'HBP'))
+# Where the batter ends up on each hit type
+_HIT_BATTER_END = {"Single": "1B", "Double": "2B", "Triple": "3B", "Home Run": "score"}
+# Total bases and the extra-base stat (batting and pitching) credited for each hit type
+_HIT_STATS = {"Single": (1, None), "Double": (2, "doubles"), "Triple": (3, "triples"), "Home Run": (4, "homeRuns")}
+# At-bat outcomes that move runners through _advance_runners
+_ADVANCE_TYPES = _HIT_TYPES | _WALK_TYPES
+# At-bat outcomes resolved by _handle_batted_ball_out
+_BATTED_OUT_TYPES = frozenset(('Groundout', 'Flyout', 'Sacrifice Bunt', 'Lineout', 'Pop Out', 'Forceout', 'Grounded Into DP', 'Bunt Ground Out', 'Double Play'))
+# Batted-out types the pitcher is credited with as ground outs (the rest are air outs)
+_PITCHER_GROUND_OUT_TYPES = frozenset(t for t in _BATTED_OUT_TYPES if 'Ground' in t or 'DP' in t or 'Forceout' in t or 'Bunt' in t or 'Double Play' in t)
+# Final play events of a batted-ball out, after the handler has refined them
+_OUT_PLAY_TYPES = _BATTED_OUT_TYPES | frozenset(('Sac Fly', 'Field Error'))
+# Pitch locations, drawn by bisecting cumulative weights (the same draw random.choices makes)
+# Weighted distribution for strike zones (1-9)
+# Corners (1, 3, 7, 9) and Edges (2, 4, 6, 8) are more common than Center (5)
+# Weights: Corners=1.5, Edges=1.0, Center=0.6
+_STRIKE_ZONES = (1, 2, 3, 4, 5, 6, 7, 8, 9)
+_STRIKE_ZONE_CUM = tuple(accumulate((1.5, 1.0, 1.5, 1.0, 0.6, 1.0, 1.5, 1.0, 1.5)))
+_STRIKE_ZONE_TOTAL = _STRIKE_ZONE_CUM[-1] + 0.0
+# Ball locations: 11 (High-Left), 12 (High-Right), 13 (Low-Left), 14 (Low-Right)
+# Low pitches (dirt) are more common than high misses generally
+# Weights: Low (13, 14)=3.0, High (11, 12)=2.0
+_BALL_ZONES = (11, 12, 13, 14)
+_BALL_ZONE_CUM = tuple(accumulate((2.0, 2.0, 3.0, 3.0)))
+_BALL_ZONE_TOTAL = _BALL_ZONE_CUM[-1] + 0.0
+# Runner-entry labels for bases, indexed like self.bases
+_BASE_LABELS = ("1B", "2B", "3B")
+# Matchup keys for the runners left on base after a play, indexed like self.bases
+_POST_ON_BASE_KEYS = ("postOnFirst", "postOnSecond", "postOnThird")
+# Share of contact that goes foul rather than into play
+_FOUL_RATE = 0.6
+# MLB event type codes for play results; unlisted events are snake_cased
+_EVENT_TYPE_MAP = {
+    "Lineout": "field_out",
+    "Pop Out": "field_out",
+    "Flyout": "field_out",
+    "Groundout": "field_out",
+    "Forceout": "force_out",
+    "Double Play": "grounded_into_double_play",
+    "Sac Fly": "sac_fly",
+    "Sac Bunt": "sac_bunt",
+    "Sacrifice Bunt": "sac_bunt",
+    "Single": "single",
+    "Double": "double",
+    "Triple": "triple",
+    "Home Run": "home_run",
+    "Walk": "walk",
+    "Hit By Pitch": "hit_by_pitch",
+    "Strikeout": "strikeout",
+    "Field Error": "field_error"
+}
+# Men-on-base split indexed by occupancy mask (bit 0 = first, bit 1 = second, bit 2 = third)
+_MEN_ON_BASE_SPLITS = ("Empty", "Men_On", "RISP", "RISP", "RISP", "RISP", "RISP", "Loaded")
+# Boxscore stat templates, shallow-copied per player/team; per-player fields are set after copying
+_EMPTY_BATTING = {
+    "gamesPlayed": 1, "flyOuts": 0, "groundOuts": 0, "runs": 0, "doubles": 0, "triples": 0,
+    "homeRuns": 0, "strikeOuts": 0, "baseOnBalls": 0, "intentionalWalks": 0, "hits": 0,
+    "hitByPitch": 0, "atBats": 0, "caughtStealing": 0, "stolenBases": 0,
+    "groundIntoDoublePlay": 0, "groundIntoTriplePlay": 0, "plateAppearances": 0,
+    "totalBases": 0, "rbi": 0, "leftOnBase": 0, "sacBunts": 0, "sacFlies": 0,
+    "catchersInterference": 0, "pickoffs": 0
+}
+_EMPTY_PITCHING = {
+    "gamesPlayed": 0, "gamesStarted": 0,
+    "groundOuts": 0, "airOuts": 0, "runs": 0, "doubles": 0, "triples": 0, "homeRuns": 0,
+    "strikeOuts": 0, "baseOnBalls": 0, "intentionalWalks": 0, "hits": 0, "hitByPitch": 0,
+    "atBats": 0, "caughtStealing": 0, "stolenBases": 0, "inningsPitched": "0.0", "wins": 0,
+    "losses": 0, "saves": 0, "saveOpportunities": 0, "holds": 0, "blownSaves": 0,
+    "earnedRuns": 0, "whip": "0.00", "outs": 0, "numberOfPitches": 0, "strikes": 0, "balls": 0
+}
+_EMPTY_FIELDING = {
+    "gamesPlayed": 1, "gamesStarted": 0,
+    "assists": 0, "putOuts": 0, "errors": 0, "chances": 0, "fielding": "0.000",
+    "position": None
+}
+_EMPTY_TEAM_BATTING = {
+    "flyOuts": 0, "groundOuts": 0, "airOuts": 0, "runs": 0, "doubles": 0, "triples": 0,
+    "homeRuns": 0, "strikeOuts": 0, "baseOnBalls": 0, "intentionalWalks": 0, "hits": 0,
+    "hitByPitch": 0, "atBats": 0, "caughtStealing": 0, "stolenBases": 0,
+    "groundIntoDoublePlay": 0, "groundIntoTriplePlay": 0, "plateAppearances": 0,
+    "totalBases": 0, "rbi": 0, "leftOnBase": 0, "sacBunts": 0, "sacFlies": 0,
+    "catchersInterference": 0, "pickoffs": 0, "popOuts": 0, "lineOuts": 0
+}
+_EMPTY_TEAM_PITCHING = {
+    "flyOuts": 0, "groundOuts": 0, "airOuts": 0, "runs": 0, "doubles": 0, "triples": 0,
+    "homeRuns": 0, "strikeOuts": 0, "baseOnBalls": 0, "intentionalWalks": 0, "hits": 0,
+    "hitByPitch": 0, "atBats": 0, "caughtStealing": 0, "stolenBases": 0,
+    "numberOfPitches": 0, "inningsPitched": "0.0", "earnedRuns": 0, "battersFaced": 0,
+    "outs": 0, "balls": 0, "strikes": 0, "hitBatsmen": 0, "balks": 0, "wildPitches": 0,
+    "pickoffs": 0, "rbi": 0, "sacBunts": 0, "sacFlies": 0, "popOuts": 0, "lineOuts": 0
+}
+_EMPTY_TEAM_FIELDING = {
+    "assists": 0, "putOuts": 0, "errors": 0, "chances": 0,
+    "caughtStealing": 0, "stolenBases": 0, "passedBall": 0, "pickoffs": 0
+}
+# Fielding stats that also count as a chance
+_CHANCE_STATS = frozenset(('putOuts', 'assists', 'errors'))
+# Player status template, copied per player like the stat templates
+_STATUS_ACTIVE = {"code": "A", "description": "Active"}
+# Bat side templates, copied into each game's matchup cache
+_RIGHT_HANDED = {"code": "R", "description": "Right"}
+_LEFT_HANDED = {"code": "L", "description": "Left"}
+
+
+def _index_by_name(*groups):
+    """Map legal_name -> player, keeping the first match in group order like a linear scan would."""
+    index = {}
+    for group in groups:
+        for p in group:
+            index.setdefault(p['legal_name'], p)
+    return index
+
+
+# Bios depend only on the player id, so one cache keyed by id can never go stale
+_PLAYER_BIOS = {}
+
+
+def _player_bio(player_id):
+    """
+    Mock realistic bio data, seeded by player ID so it is consistent across games.
+    Returns (birth_date, current_age, height, weight, draft_year, debut_date), drawn once per id.
+    """
+    bio = _PLAYER_BIOS.get(player_id)
+    if bio is not None:
+        return bio
+    rng = random.Random(player_id)
+
+    birth_year = rng.randint(1995, 2003)
+    birth_month = rng.randint(1, 12)
+    birth_day = rng.randint(1, 28)
+    birth_date = f"{birth_year}-{birth_month:02d}-{birth_day:02d}"
+    current_age = 2025 - birth_year # Assuming current year 2025
+
+    height_feet = rng.randint(5, 6)
+    height_inches = rng.randint(0, 11)
+    if height_feet == 6: height_inches = rng.randint(0, 8)
+    height = f"{height_feet}' {height_inches}\""
+
+    weight = rng.randint(170, 240)
+
+    draft_year = birth_year + 18 + rng.randint(0, 3)
+    debut_year = draft_year + rng.randint(2, 5)
+    debut_date = f"{debut_year}-04-01"
+    bio = _PLAYER_BIOS[player_id] = (birth_date, current_age, height, weight, draft_year, debut_date)
+    return bio
+
+
+# Name splits keyed by the legal name they were split from
+_NAME_PARTS = {}
+
+
+def _split_name(full_name):
+    """Split a legal name into (first, middle, last) for the player details, once per distinct name."""
+    parts = _NAME_PARTS.get(full_name)
+    if parts is not None:
+        return parts
+    name_parts = full_name.split(' ')
+    first_name = name_parts[0]
+    last_name = name_parts[-1] if len(name_parts) > 1 else ""
+    middle_name = " ".join(name_parts[1:-1]) if len(name_parts) > 2 else ""
+    parts = _NAME_PARTS[full_name] = (first_name, middle_name, last_name)
+    return parts
+
+
 class BaseballSimulator:
     """
     Simulates a modern MLB game with realistic rules and enhanced realism.
@@ -16,28 +195,50 @@ class BaseballSimulator:
     - Varied pitch velocities.
     """
 
-    def __init__(self, team1_data, team2_data, max_innings=None, game_seed=None):
+    def __init__(self, team1_data, team2_data, max_innings=None, game_seed=None, play_sink=None):
+        """
+        play_sink, if given, is called with each play as it completes instead of
+        collecting plays in gameday_data's allPlays, so long batch runs can stream
+        plays out without holding them in memory (see JsonPlayWriter for a file-backed sink).
+
+        Within a game, plays of the same batter/pitcher pairing share their matchup batter,
+        pitcher and hand dicts, and pitches of the same type share one type dict, so treat
+        emitted plays as read-only and copy one before editing it.
+        """
         self.team1_data = team1_data
         self.team2_data = team2_data
         self.team1_name = self.team1_data["name"]
         self.team2_name = self.team2_data["name"]
         self.max_innings = max_innings
         self.game_rng = random.Random(game_seed)
+        self._rand = self.game_rng.random  # bound once; uniform draws are the hottest RNG call
 
         # Setup lineups and pitchers
         self.team1_lineup = [p for p in self.team1_data["players"] if p['position']['abbreviation'] != 'P']
         self.team2_lineup = [p for p in self.team2_data["players"] if p['position']['abbreviation'] != 'P']
-        
+        # People API links for play references, keyed by id so the caller's roster dicts are left untouched
+        self._person_links = {p['id']: f"/api/v1/people/{p['id']}"
+                              for team_data in (self.team1_data, self.team2_data) for p in team_data['players']}
+
+        self._arsenal = {}  # pitcher name -> (names, cum weights, total, velo ranges, spin ranges, type objects)
         self._setup_pitchers(self.team1_data, 'team1')
         self._setup_pitchers(self.team2_data, 'team2')
 
         # Setup defensive positions
         self._setup_defense('team1', self.team1_data)
         self._setup_defense('team2', self.team2_data)
+        # Per-side fielding references, indexed like _offense: 0 for the home team (team1), 1 for the away team (team2)
+        self._fielding = [self._build_fielding('team1', self.team1_data), self._build_fielding('team2', self.team2_data)]
 
         # Game state
-        self.team1_batter_idx, self.team2_batter_idx = 0, 0
-        self.team1_score, self.team2_score = 0, 0
+        # Per-side offensive state, indexed 0 for the home team (team1) and 1 for the away team (team2)
+        self._offense = [
+            {'lineup': self.team1_lineup, 'lineup_by_name': _index_by_name(self.team1_lineup), 'batter_idx': 0},
+            {'lineup': self.team2_lineup, 'lineup_by_name': _index_by_name(self.team2_lineup), 'batter_idx': 0},
+        ]
+        # Runner lookups check both lineups before the full rosters (pitchers, etc.)
+        self._player_by_name = _index_by_name(self.team1_lineup, self.team2_lineup, self.team1_data['players'], self.team2_data['players'])
+        self._scores = [0, 0]
         self.inning, self.top_of_inning = 1, True
         self.outs, self.bases = 0, [None, None, None] # Runners on base by name
 
@@ -55,6 +256,11 @@ class BaseballSimulator:
         self.gameday_data: GamedayData | None = None
         self._pitch_event_seq = 0
         self._initialize_gameday_data()
+        self._index_boxscore_stats()
+        self._emit_play = play_sink if play_sink is not None else self.gameday_data['liveData']['plays']['allPlays'].append
+        self._linescore = self.gameday_data['liveData']['linescore']
+        self._at_bat_index = 0
+        self._matchup_cache = {}
 
         # Game context
         self.umpires = self.game_rng.sample(GAME_CONTEXT["umpires"], 4)
@@ -73,35 +279,10 @@ class BaseballSimulator:
             for p in team_data['players']:
                 pid = f"ID{p['id']}"
 
-                # Split name for details
                 full_name = p['legal_name']
-                name_parts = full_name.split(' ')
-                first_name = name_parts[0]
-                last_name = name_parts[-1] if len(name_parts) > 1 else ""
-                middle_name = " ".join(name_parts[1:-1]) if len(name_parts) > 2 else ""
-
-                # Mock realistic bio data
-                # Use player ID as seed component for consistency across games if desired,
-                # but here we use game_rng for game-specific flavor or just stick to static mocks if prefered.
-                # To be safe and realistic, let's generate some consistent-ish data based on ID.
-                rng = random.Random(p['id'])
-
-                birth_year = rng.randint(1995, 2003)
-                birth_month = rng.randint(1, 12)
-                birth_day = rng.randint(1, 28)
-                birth_date = f"{birth_year}-{birth_month:02d}-{birth_day:02d}"
-                current_age = 2025 - birth_year # Assuming current year 2025
-
-                height_feet = rng.randint(5, 6)
-                height_inches = rng.randint(0, 11)
-                if height_feet == 6: height_inches = rng.randint(0, 8)
-                height = f"{height_feet}' {height_inches}\""
-
-                weight = rng.randint(170, 240)
-
-                draft_year = birth_year + 18 + rng.randint(0, 3)
-                debut_year = draft_year + rng.randint(2, 5)
-                debut_date = f"{debut_year}-04-01"
+                first_name, middle_name, last_name = _split_name(full_name)
+
+                birth_date, current_age, height, weight, draft_year, debut_date = _player_bio(p['id'])
 
                 player_detail = {
                     "id": p['id'],
@@ -198,12 +379,21 @@ class BaseballSimulator:
         bullpen = []
         batting_order = []
 
-        lineup_ids = [p['id'] for p in lineup]
+        order_by_id = {p['id']: i for i, p in enumerate(lineup)}
 
         for p in team_data['players']:
             pid = f"ID{p['id']}"
             is_pitcher = p['position']['abbreviation'] == 'P'
-            is_starter = p in lineup
+            is_starter = p['id'] in order_by_id
+            is_starting_pitcher = is_pitcher and p['type'] == 'Starter'
+
+            batting = _EMPTY_BATTING.copy()
+            pitching = _EMPTY_PITCHING.copy()
+            pitching["gamesPlayed"] = 1 if is_pitcher else 0
+            pitching["gamesStarted"] = 1 if is_starting_pitcher else 0
+            fielding = _EMPTY_FIELDING.copy()
+            fielding["gamesStarted"] = 1 if is_starter or is_starting_pitcher else 0
+            fielding["position"] = p['position']
 
             player_entry = {
                 "person": {
@@ -213,31 +403,13 @@ class BaseballSimulator:
                 },
                 "jerseyNumber": str(p['id'] % 100),
                 "position": p['position'],
-                "status": {"code": "A", "description": "Active"},
+                "status": _STATUS_ACTIVE.copy(),
                 "parentTeamId": team_data['id'],
-                "battingOrder": str((lineup_ids.index(p['id']) + 1) * 100) if is_starter else None,
+                "battingOrder": str((order_by_id[p['id']] + 1) * 100) if is_starter else None,
                 "stats": {
-                    "batting": {
-                        "gamesPlayed": 1, "flyOuts": 0, "groundOuts": 0, "runs": 0, "doubles": 0, "triples": 0,
-                        "homeRuns": 0, "strikeOuts": 0, "baseOnBalls": 0, "intentionalWalks": 0, "hits": 0,
-                        "hitByPitch": 0, "atBats": 0, "caughtStealing": 0, "stolenBases": 0,
-                        "groundIntoDoublePlay": 0, "groundIntoTriplePlay": 0, "plateAppearances": 0,
-                        "totalBases": 0, "rbi": 0, "leftOnBase": 0, "sacBunts": 0, "sacFlies": 0,
-                        "catchersInterference": 0, "pickoffs": 0
-                    },
-                    "pitching": {
-                        "gamesPlayed": 1 if is_pitcher else 0, "gamesStarted": 1 if is_pitcher and p['type'] == 'Starter' else 0,
-                        "groundOuts": 0, "airOuts": 0, "runs": 0, "doubles": 0, "triples": 0, "homeRuns": 0,
-                        "strikeOuts": 0, "baseOnBalls": 0, "intentionalWalks": 0, "hits": 0, "hitByPitch": 0,
-                        "atBats": 0, "caughtStealing": 0, "stolenBases": 0, "inningsPitched": "0.0", "wins": 0,
-                        "losses": 0, "saves": 0, "saveOpportunities": 0, "holds": 0, "blownSaves": 0,
-                        "earnedRuns": 0, "whip": "0.00", "outs": 0, "numberOfPitches": 0, "strikes": 0, "balls": 0
-                    },
-                    "fielding": {
-                         "gamesPlayed": 1, "gamesStarted": 1 if is_starter or (is_pitcher and p['type'] == 'Starter') else 0,
-                         "assists": 0, "putOuts": 0, "errors": 0, "chances": 0, "fielding": "0.000",
-                         "position": p['position']
-                    }
+                    "batting": batting,
+                    "pitching": pitching,
+                    "fielding": fielding
                 },
                 "seasonStats": {"batting": {}, "pitching": {}, "fielding": {}},
                 "gameStatus": {"isCurrentBatter": False, "isCurrentPitcher": False, "isOnBench": not is_starter and not is_pitcher, "isSubstitute": False}
@@ -263,26 +435,9 @@ class BaseballSimulator:
                 "teamName": team_data['teamName']
             },
             "teamStats": {
-                "batting": {
-                    "flyOuts": 0, "groundOuts": 0, "airOuts": 0, "runs": 0, "doubles": 0, "triples": 0,
-                    "homeRuns": 0, "strikeOuts": 0, "baseOnBalls": 0, "intentionalWalks": 0, "hits": 0,
-                    "hitByPitch": 0, "atBats": 0, "caughtStealing": 0, "stolenBases": 0,
-                    "groundIntoDoublePlay": 0, "groundIntoTriplePlay": 0, "plateAppearances": 0,
-                    "totalBases": 0, "rbi": 0, "leftOnBase": 0, "sacBunts": 0, "sacFlies": 0,
-                    "catchersInterference": 0, "pickoffs": 0, "popOuts": 0, "lineOuts": 0
-                },
-                "pitching": {
-                    "flyOuts": 0, "groundOuts": 0, "airOuts": 0, "runs": 0, "doubles": 0, "triples": 0,
-                    "homeRuns": 0, "strikeOuts": 0, "baseOnBalls": 0, "intentionalWalks": 0, "hits": 0,
-                    "hitByPitch": 0, "atBats": 0, "caughtStealing": 0, "stolenBases": 0,
-                    "numberOfPitches": 0, "inningsPitched": "0.0", "earnedRuns": 0, "battersFaced": 0,
-                    "outs": 0, "balls": 0, "strikes": 0, "hitBatsmen": 0, "balks": 0, "wildPitches": 0,
-                    "pickoffs": 0, "rbi": 0, "sacBunts": 0, "sacFlies": 0, "popOuts": 0, "lineOuts": 0
-                },
-                "fielding": {
-                    "assists": 0, "putOuts": 0, "errors": 0, "chances": 0,
-                    "caughtStealing": 0, "stolenBases": 0, "passedBall": 0, "pickoffs": 0
-                }
+                "batting": _EMPTY_TEAM_BATTING.copy(),
+                "pitching": _EMPTY_TEAM_PITCHING.copy(),
+                "fielding": _EMPTY_TEAM_FIELDING.copy()
             },
             "players": players,
             "batters": batters,
@@ -294,45 +449,72 @@ class BaseballSimulator:
             "note": []
         }
 
+    def _index_boxscore_stats(self):
+        """
+        Indexes each boxscore stats dict by (team_key, player_id) and team_key, per category,
+        so the _update_*_stat helpers write into them without walking gameday_data.
+        """
+        self._player_stats = {'batting': {}, 'pitching': {}, 'fielding': {}}
+        self._team_stats = {'batting': {}, 'pitching': {}, 'fielding': {}}
+        for team_key, team in self.gameday_data['liveData']['boxscore']['teams'].items():
+            for category, by_player in self._player_stats.items():
+                by_player[team_key] = {entry['person']['id']: entry['stats'][category] for entry in team['players'].values()}
+                self._team_stats[category][team_key] = team['teamStats'][category]
+
     def _update_batting_stat(self, team_key, player_id, stat_key, value=1):
-        pid_key = f"ID{player_id}"
-        stats = self.gameday_data['liveData']['boxscore']['teams'][team_key]['players'][pid_key]['stats']['batting']
-        team_stats = self.gameday_data['liveData']['boxscore']['teams'][team_key]['teamStats']['batting']
+        stats = self._player_stats['batting'][team_key][player_id]
+        team_stats = self._team_stats['batting'][team_key]
         if stat_key in stats:
             stats[stat_key] += value
         if stat_key in team_stats:
             team_stats[stat_key] += value
 
     def _update_pitching_stat(self, team_key, player_id, stat_key, value=1):
-        pid_key = f"ID{player_id}"
-        stats = self.gameday_data['liveData']['boxscore']['teams'][team_key]['players'][pid_key]['stats']['pitching']
-        team_stats = self.gameday_data['liveData']['boxscore']['teams'][team_key]['teamStats']['pitching']
+        stats = self._player_stats['pitching'][team_key][player_id]
+        team_stats = self._team_stats['pitching'][team_key]
         if stat_key in stats:
             stats[stat_key] += value
-            if stat_key == 'outs':
-                outs = stats['outs']
-                stats['inningsPitched'] = f"{outs // 3}.{outs % 3}"
-
         if stat_key in team_stats:
             team_stats[stat_key] += value
-            if stat_key == 'outs':
-                outs = team_stats['outs']
-                team_stats['inningsPitched'] = f"{outs // 3}.{outs % 3}"
+
+    def _format_innings_pitched(self, team_key):
+        """
+        Writes inningsPitched from outs for one team's pitchers and team line; the per-out updates only count outs.
+        Called as each half-inning ends, so the boxscore is current between half-innings.
+        """
+        team_line = self._team_stats['pitching'][team_key]
+        for pitching in (*self._player_stats['pitching'][team_key].values(), team_line):
+            outs = pitching['outs']
+            pitching['inningsPitched'] = f"{outs // 3}.{outs % 3}"
 
     def _update_fielding_stat(self, team_key, player_id, stat_key, value=1):
-        pid_key = f"ID{player_id}"
-        stats = self.gameday_data['liveData']['boxscore']['teams'][team_key]['players'][pid_key]['stats']['fielding']
-        team_stats = self.gameday_data['liveData']['boxscore']['teams'][team_key]['teamStats']['fielding']
+        stats = self._player_stats['fielding'][team_key][player_id]
+        team_stats = self._team_stats['fielding'][team_key]
         if stat_key in stats:
             stats[stat_key] += value
-            if stat_key in ['putOuts', 'assists', 'errors']:
+            if stat_key in _CHANCE_STATS:
                 stats['chances'] += value
 
         if stat_key in team_stats:
             team_stats[stat_key] += value
-            if stat_key in ['putOuts', 'assists', 'errors']:
+            if stat_key in _CHANCE_STATS:
                 team_stats['chances'] += value
 
+    def _credit_pitches(self, team_key, player_id, pitches, balls):
+        """Adds an at-bat's pitches to the pitcher's and team's pitch, ball and strike totals."""
+        for stats in (self._player_stats['pitching'][team_key][player_id], self._team_stats['pitching'][team_key]):
+            stats['numberOfPitches'] += pitches
+            stats['strikes'] += pitches - balls
+            stats['balls'] += balls
+
+    @property
+    def team1_score(self):
+        return self._scores[0]
+
+    @property
+    def team2_score(self):
+        return self._scores[1]
+
     @property
     def _batting_team_key(self):
         return 'away' if self.top_of_inning else 'home'
@@ -342,14 +524,35 @@ class BaseballSimulator:
         return 'home' if self.top_of_inning else 'away'
 
     def _setup_pitchers(self, team_data, team_prefix):
-        all_pitchers = [p for p in team_data["players"] if p['position']['abbreviation'] == 'P']
-        pitcher_stats = {p['legal_name']: p.copy() for p in all_pitchers}
-        bullpen_candidates = [p['legal_name'] for p in all_pitchers if p['type'] != 'Starter']
-        closers = [name for name in bullpen_candidates if pitcher_stats[name]['type'] == 'Closer']
-        non_closers = [name for name in bullpen_candidates if pitcher_stats[name]['type'] != 'Closer']
+        # Pitcher entries are shared with the roster; per-game state (pitch counts, arsenal tables) lives on the simulator.
+        pitcher_stats = {}
+        starters, closers, non_closers = [], [], []
+        pitch_type_map = GAME_CONTEXT['PITCH_TYPE_MAP']
+        for p in team_data["players"]:
+            if p['position']['abbreviation'] != 'P':
+                continue
+            name = p['legal_name']
+            pitcher_stats[name] = p
+            if p['type'] == 'Starter': starters.append(name)
+            elif p['type'] == 'Closer': closers.append(name)
+            else: non_closers.append(name)
+
+            # Pitch selection draws from the same arsenal every pitch; precompute its inputs once per game.
+            # Kept on the simulator, not the roster entry, so edits to a roster's arsenal are always picked up.
+            arsenal = p['pitch_arsenal']
+            pitch_names = list(arsenal.keys())
+            pitch_cum = list(accumulate(v['prob'] for v in arsenal.values()))
+            self._arsenal[name] = (
+                pitch_names, pitch_cum, pitch_cum[-1] + 0.0,
+                [v['velo_range'] for v in arsenal.values()],
+                [v.get('spin_range', (2000, 2500)) for v in arsenal.values()],
+                # Pitch type objects are read-only once emitted, so every event of a pitch type shares one
+                [{'code': pitch_type_map.get(pitch, 'UN'), 'description': pitch.capitalize()} for pitch in pitch_names],
+            )
+
         self.game_rng.shuffle(non_closers)
         available_bullpen = non_closers + closers
-        current_pitcher_name = next(p['legal_name'] for p in all_pitchers if p['type'] == 'Starter')
+        current_pitcher_name = starters[0]
 
         setattr(self, f"{team_prefix}_pitcher_stats", pitcher_stats)
         setattr(self, f"{team_prefix}_available_bullpen", available_bullpen)
@@ -362,14 +565,47 @@ class BaseballSimulator:
         defense = {p['position']['abbreviation']: p for p in team_data['players']}
         setattr(self, f"{team_prefix}_defense", defense)
 
-        infielders = ['1B', '2B', '3B', 'SS']
-        outfielders = ['LF', 'CF', 'RF']
-
-        setattr(self, f"{team_prefix}_infielders", [defense[pos] for pos in infielders if pos in defense])
-        setattr(self, f"{team_prefix}_outfielders", [defense[pos] for pos in outfielders if pos in defense])
+        setattr(self, f"{team_prefix}_infielders", [defense[pos] for pos in _INFIELD_ORDER if pos in defense])
+        setattr(self, f"{team_prefix}_outfielders", [defense[pos] for pos in _OUTFIELD_ORDER if pos in defense])
         setattr(self, f"{team_prefix}_catcher", defense.get('C'))
 
-    def _simulate_pitch_trajectory(self, pitcher, batter=None):
+    def _build_fielding(self, team_prefix, team_data):
+        """
+        Bundles a team's fielding references, plus cumulative fielder weights for batted-ball outs.
+        Ground balls go to an infielder (6), the pitcher (1) or the catcher (0.25); fly balls to an outfielder (6) or an infielder (1).
+        """
+        infielders = getattr(self, f"{team_prefix}_infielders")
+        outfielders = getattr(self, f"{team_prefix}_outfielders")
+        catcher = getattr(self, f"{team_prefix}_catcher")
+        ground_cum = list(accumulate([6] * len(infielders) + [1] + ([0.25] if catcher else [])))
+        fly_cum = list(accumulate([6] * len(outfielders) + [1] * len(infielders)))
+        return {
+            'defense': getattr(self, f"{team_prefix}_defense"), 'infielders': infielders, 'outfielders': outfielders,
+            'catcher': catcher, 'pitcher_stats': getattr(self, f"{team_prefix}_pitcher_stats"),
+            'fielding_prowess': team_data['fielding_prowess'], 'double_play_rate': team_data['double_play_rate'],
+            'ground_cum': ground_cum, 'ground_total': ground_cum[-1] + 0.0,
+            'fly_candidates': outfielders + infielders, 'fly_cum': fly_cum, 'fly_total': fly_cum[-1] + 0.0,
+        }
+
+    def _pitch_around_penalty(self, batter):
+        """Strike-rate penalty applied when pitching around a dangerous batter."""
+        pitch_around_penalty = 0.0
+        profile = batter.get('batting_profile', {})
+        power = profile.get('power', 0.5)
+        contact = profile.get('contact', 0.7)
+
+        # Simple threat model: Power over 0.70 starts to matter
+        if power > 0.70:
+            pitch_around_penalty += (power - 0.70) * 0.15
+
+        # High contact batters also get some respect if they have decent power
+        if contact > 0.85 and power > 0.50:
+            pitch_around_penalty += (contact - 0.85) * 0.10
+
+        # Cap the penalty to avoid breaking the game (max ~5% drop in strike rate)
+        return min(pitch_around_penalty, 0.06)
+
+    def _simulate_pitch_trajectory(self, pitcher, fatigue_penalty=0.0, pitch_around_penalty=0.0):
         """
         Simulates the pitch's path and determines if it's in the strike zone.
         Returns a tuple: (is_strike_loc, zone_code)
@@ -379,51 +615,24 @@ class BaseballSimulator:
         13: Inside (Ball)
         14: Low (Ball)
         """
-        fatigue_penalty = (max(0, self.pitch_counts[pitcher['legal_name']] - pitcher['stamina']) / 15) * 0.1
-
-        # Determine "pitch around" penalty based on batter threat
-        pitch_around_penalty = 0.0
-        if batter:
-            profile = batter.get('batting_profile', {})
-            power = profile.get('power', 0.5)
-            contact = profile.get('contact', 0.7)
-
-            # Simple threat model: Power over 0.70 starts to matter
-            if power > 0.70:
-                pitch_around_penalty += (power - 0.70) * 0.15
-
-            # High contact batters also get some respect if they have decent power
-            if contact > 0.85 and power > 0.50:
-                pitch_around_penalty += (contact - 0.85) * 0.10
-
-            # Cap the penalty to avoid breaking the game (max ~5% drop in strike rate)
-            pitch_around_penalty = min(pitch_around_penalty, 0.06)
-
         # Add a small penalty to control to increase walks slightly
-        is_strike = self.game_rng.random() < (pitcher['control'] - fatigue_penalty - 0.012 - pitch_around_penalty)
+        is_strike = self._rand() < (pitcher['control'] - fatigue_penalty - 0.012 - pitch_around_penalty)
 
         if is_strike:
-            # Weighted distribution for strike zones (1-9)
-            # Corners (1, 3, 7, 9) and Edges (2, 4, 6, 8) are more common than Center (5)
-            # Weights: Corners=1.5, Edges=1.0, Center=0.6
-            zones = [1, 2, 3, 4, 5, 6, 7, 8, 9]
-            weights = [1.5, 1.0, 1.5, 1.0, 0.6, 1.0, 1.5, 1.0, 1.5]
-            zone = self.game_rng.choices(zones, weights=weights, k=1)[0]
+            zone = _STRIKE_ZONES[bisect(_STRIKE_ZONE_CUM, self._rand() * _STRIKE_ZONE_TOTAL, 0, 8)]
         else:
-            # Ball locations: 11 (High-Left), 12 (High-Right), 13 (Low-Left), 14 (Low-Right)
-            # Low pitches (dirt) are more common than high misses generally
-            # Weights: Low (13, 14)=3.0, High (11, 12)=2.0
-            zones = [11, 12, 13, 14]
-            weights = [2.0, 2.0, 3.0, 3.0]
-            zone = self.game_rng.choices(zones, weights=weights, k=1)[0]
+            zone = _BALL_ZONES[bisect(_BALL_ZONE_CUM, self._rand() * _BALL_ZONE_TOTAL, 0, 3)]
 
         return is_strike, zone
 
-    def _simulate_bat_swing(self, batter, is_strike_loc):
-        """Determines if the batter swings at the pitch."""
+    def _swing_at_ball_prob(self, batter):
+        """Chance the batter chases a pitch outside the zone."""
         discipline_factor = max(0.1, batter['plate_discipline'].get('Walk', 0.09) / 0.08)
-        swing_at_ball_prob = 0.14 / discipline_factor
-        return self.game_rng.random() < (0.85 if is_strike_loc else swing_at_ball_prob)
+        return 0.14 / discipline_factor
+
+    def _simulate_bat_swing(self, is_strike_loc, swing_at_ball_prob):
+        """Determines if the batter swings at the pitch."""
+        return self._rand() < (0.85 if is_strike_loc else swing_at_ball_prob)
 
     def _simulate_batted_ball_physics(self, batter):
         """Calculates the exit velocity and launch angle of a batted ball."""
@@ -453,7 +662,7 @@ class BaseballSimulator:
         if la < 12:
             if ev > 108: return "Double Play" # Hard grounder at infielder
             if ev > 102: return "Single" # Hard grounder through the hole
-            if ev > 92 and self.game_rng.random() < 0.30: return "Single" # Lucky finder
+            if ev > 92 and self._rand() < 0.30: return "Single" # Lucky finder
             return "Groundout"
 
         # Line drives
@@ -469,29 +678,13 @@ class BaseballSimulator:
         if la < 46:
             if ev > 104: return "Home Run" # Reduced threshold
             if ev > 103: return "Double" # Gap shot
-            if ev > 94 and self.game_rng.random() < 0.3: return "Double"
-            if ev > 90 and self.game_rng.random() < 0.28: return "Single" # Bloop
+            if ev > 94 and self._rand() < 0.3: return "Double"
+            if ev > 90 and self._rand() < 0.28: return "Single" # Bloop
             if ev > 99 and la > 40: return "Triple"
             return "Flyout"
 
         return "Pop Out" # Very high flyball
 
-    def _classify_out_trajectory(self, la):
-        """Classify the trajectory of a batted ball that results in an out."""
-        if la is None:
-            return "ground_ball"  # default
-
-        if la < -15:
-            return "ground_ball"
-        elif -15 <= la < 10:
-            return "ground_ball"
-        elif 10 <= la <= 25:
-            return "line_drive"
-        elif 25 < la <= 45:
-            return "fly_ball"
-        else:  # la > 45
-            return "popup"
-
     def _get_specific_out_type(self, base_type, trajectory, batted_ball_data):
         """Map base out type and trajectory to specific MLB event type."""
 
@@ -516,26 +709,7 @@ class BaseballSimulator:
 
     def _get_event_type_code(self, event):
         """Convert event name to MLB event type code."""
-        event_map = {
-            "Lineout": "field_out",
-            "Pop Out": "field_out",
-            "Flyout": "field_out",
-            "Groundout": "field_out",
-            "Forceout": "force_out",
-            "Double Play": "grounded_into_double_play",
-            "Sac Fly": "sac_fly",
-            "Sac Bunt": "sac_bunt",
-            "Sacrifice Bunt": "sac_bunt",
-            "Single": "single",
-            "Double": "double",
-            "Triple": "triple",
-            "Home Run": "home_run",
-            "Walk": "walk",
-            "Hit By Pitch": "hit_by_pitch",
-            "Strikeout": "strikeout",
-            "Field Error": "field_error"
-        }
-        return event_map.get(event, event.lower().replace(" ", "_"))
+        return _EVENT_TYPE_MAP.get(event) or event.lower().replace(" ", "_")
 
     def _determine_hit_location(self, hit_type, ev, la):
         if la is None or ev is None: return "CF"
@@ -550,40 +724,70 @@ class BaseballSimulator:
             return self.game_rng.choice(["DLF", "DCF", "DRF"])
         return "CF"
 
+    def _build_hit_data(self, hit_result, ev, la):
+        """Builds the hitData for a ball in play in one pass over its exit velocity and launch angle."""
+        hit_data: HitData = {'launchSpeed': ev, 'launchAngle': la, 'trajectory': self._get_trajectory(hit_result, la)}
+        if hit_result in _HIT_TYPES:
+            hit_data['location'] = self._determine_hit_location(hit_result, ev, la)
+        return hit_data
+
     def _get_trajectory(self, outcome, la):
         if "Groundout" in outcome: return "ground_ball"
         if la is not None:
             if la < 10: return "ground_ball"
-            elif 10 <= la <= 25: return "line_drive"
+            elif la <= 25: return "line_drive"
             elif la > 50: return "popup"
         return "fly_ball"
 
     def _get_men_on_base_split(self, bases):
         """Determine the men on base split category."""
-        if not any(bases):
-            return "Empty"
-        elif all(bases):
-            return "Loaded"
-        elif bases[1] or bases[2]:  # Runner in scoring position
-            return "RISP"
-        else:
-            return "Men_On"
+        r1, r2, r3 = bases
+        return _MEN_ON_BASE_SPLITS[(r1 is not None) | (r2 is not None) << 1 | (r3 is not None) << 2]
 
     def _build_matchup(self, batter, pitcher, pre_play_bases=None):
         """Build the matchup object for gameday JSON."""
+        key = (batter['id'], pitcher['id'])
+        static = self._matchup_cache.get(key)
+        if static is None:
+            static = self._matchup_cache[key] = self._build_matchup_static(batter, pitcher)
+        batter_info, batter_bat_side, pitcher_info, pitch_hand, batter_split, pitcher_split = static
+
+        # Determine men on base situation (use pre-play bases if provided)
+        bases_to_check = pre_play_bases if pre_play_bases is not None else self.bases
+        men_on = self._get_men_on_base_split(bases_to_check)
+
+        matchup = {
+            "batter": batter_info,
+            "batSide": batter_bat_side,
+            "pitcher": pitcher_info,
+            "pitchHand": pitch_hand,
+            "splits": {
+                "batter": batter_split,
+                "pitcher": pitcher_split,
+                "menOnBase": men_on
+            }
+        }
+
+        return matchup
+
+    def _build_matchup_static(self, batter, pitcher):
+        """
+        Builds the parts of a matchup that depend only on the batter and pitcher.
+        These are cached per pairing and shared between that pairing's plays.
+        """
 
         # Batter info
         batter_info = {
             "id": batter['id'],
             "fullName": batter['legal_name'],
-            "link": f"/api/v1/people/{batter['id']}"
+            "link": self._person_links[batter['id']]
         }
 
         # Pitcher info
         pitcher_info = {
             "id": pitcher['id'],
             "fullName": pitcher['legal_name'],
-            "link": f"/api/v1/people/{pitcher['id']}"
+            "link": self._person_links[pitcher['id']]
         }
 
         # Determine splits
@@ -594,31 +798,13 @@ class BaseballSimulator:
         if batter_hand_code == 'S':
             batter_hand_code = 'L' if pitcher_hand == 'R' else 'R'
 
-        batter_bat_side = {
-            'code': batter_hand_code,
-            'description': 'Left' if batter_hand_code == 'L' else 'Right'
-        }
+        batter_bat_side = dict(_LEFT_HANDED if batter_hand_code == 'L' else _RIGHT_HANDED)
 
-        batter_split = f"vs_{'RHP' if pitcher_hand == 'R' else 'LHP'}"
-        pitcher_split = f"vs_{'RHB' if batter_hand_code == 'R' else 'LHB'}"
-
-        # Determine men on base situation (use pre-play bases if provided)
-        bases_to_check = pre_play_bases if pre_play_bases is not None else self.bases
-        men_on = self._get_men_on_base_split(bases_to_check)
-
-        matchup = {
-            "batter": batter_info,
-            "batSide": batter_bat_side,
-            "pitcher": pitcher_info,
-            "pitchHand": pitcher.get('pitchHand', {'code': 'R', 'description': 'Right'}),
-            "splits": {
-                "batter": batter_split,
-                "pitcher": pitcher_split,
-                "menOnBase": men_on
-            }
-        }
+        batter_split = "vs_RHP" if pitcher_hand == 'R' else "vs_LHP"
+        pitcher_split = "vs_RHB" if batter_hand_code == 'R' else "vs_LHB"
 
-        return matchup
+        pitch_hand = pitcher.get('pitchHand', {'code': 'R', 'description': 'Right'})
+        return batter_info, batter_bat_side, pitcher_info, pitch_hand, batter_split, pitcher_split
 
     def _build_runner_entry(self, runner_name, origin_base, end_base, is_out, out_number,
                        event, event_type, movement_reason, play_index, is_scoring,
@@ -627,21 +813,7 @@ class BaseballSimulator:
 
         # Find the runner's player object
         # This is a bit tricky since the runner could be a pinch runner or pitcher
-        runner_player = None
-
-        # Check both lineups first
-        for p in self.team1_lineup + self.team2_lineup:
-            if p['legal_name'] == runner_name:
-                runner_player = p
-                break
-
-        # If not in a lineup, check the full player lists (for pitchers, etc.)
-        if not runner_player:
-            for p in self.team1_data['players'] + self.team2_data['players']:
-                 if p['legal_name'] == runner_name:
-                    runner_player = p
-                    break
-
+        runner_player = self._player_by_name.get(runner_name)
         if not runner_player:
             return None  # Skip if player not found, though this should be rare
 
@@ -661,7 +833,7 @@ class BaseballSimulator:
                 "runner": {
                     "id": runner_player['id'],
                     "fullName": runner_player['legal_name'],
-                    "link": f"/api/v1/people/{runner_player['id']}"
+                    "link": self._person_links[runner_player['id']]
                 },
                 "isScoringEvent": is_scoring,
                 "rbi": is_rbi,
@@ -676,7 +848,7 @@ class BaseballSimulator:
         if is_scoring and responsible_pitcher:
             runner_entry["details"]["responsiblePitcher"] = {
                 "id": responsible_pitcher['id'],
-                "link": f"/api/v1/people/{responsible_pitcher['id']}"
+                "link": self._person_links[responsible_pitcher['id']]
             }
 
         return runner_entry
@@ -684,8 +856,15 @@ class BaseballSimulator:
     def _decide_steal_attempt(self, balls, strikes):
         # This method only *decides* if a steal will happen, it doesn't execute it.
         # This allows the pitch to happen first, and then we resolve the outcome.
+        r1, r2, r3 = self.bases
+        # Only a runner with the next base open can go; with none, skip the count and runner lookups
+        can_steal_third = r2 is not None and r3 is None
+        can_steal_second = r1 is not None and r2 is None
+        if not (can_steal_third or can_steal_second):
+            return None
+
         is_home_team_batting = not self.top_of_inning
-        batting_lineup = self.team1_lineup if is_home_team_batting else self.team2_lineup
+        lineup_by_name = self._offense[0 if is_home_team_batting else 1]['lineup_by_name']
 
         count_modifier = 1.0
         if (balls == 0 and strikes == 1) or (balls == 0 and strikes == 2) or (balls == 1 and strikes == 2):
@@ -694,34 +873,32 @@ class BaseballSimulator:
             count_modifier = 0.8
         outs_modifier = 1.5 if self.outs == 2 else 1.0
 
-        if self.bases[1] and not self.bases[2]:
-            runner_name = self.bases[1]
-            runner_data = next((p for p in batting_lineup if p['legal_name'] == runner_name), None)
+        if can_steal_third:
+            runner_data = lineup_by_name.get(r2)
             if runner_data:
                 # Multiplier adjusted to 1.4
                 attempt_chance = runner_data['batting_profile']['stealing_tendency'] * 1.4 * count_modifier * outs_modifier
-                if self.game_rng.random() < attempt_chance:
+                if self._rand() < attempt_chance:
                     return 3
 
-        if self.bases[0] and not self.bases[1]:
-            runner_name = self.bases[0]
-            runner_data = next((p for p in batting_lineup if p['legal_name'] == runner_name), None)
+        if can_steal_second:
+            runner_data = lineup_by_name.get(r1)
             if runner_data:
                 # Multiplier adjusted to 1.4
                 attempt_chance = runner_data['batting_profile']['stealing_tendency'] * 1.4 * count_modifier * outs_modifier
-                if self.game_rng.random() < attempt_chance:
+                if self._rand() < attempt_chance:
                     return 2
 
         return None
 
     def _resolve_steal_attempt(self, base_to_steal, play_events: list[PlayEvent], balls, strikes):
         is_home_team_batting = not self.top_of_inning
-        batting_lineup = self.team1_lineup if is_home_team_batting else self.team2_lineup
+        lineup_by_name = self._offense[0 if is_home_team_batting else 1]['lineup_by_name']
         defensive_catcher = self.team2_catcher if is_home_team_batting else self.team1_catcher
 
         base_from_idx = base_to_steal - 2
         runner_name = self.bases[base_from_idx]
-        runner_data = next((p for p in batting_lineup if p['legal_name'] == runner_name), None)
+        runner_data = lineup_by_name.get(runner_name)
 
         if not runner_data:
             return False # Should not happen
@@ -733,7 +910,7 @@ class BaseballSimulator:
         end_time = self.current_time.isoformat()
 
         success_chance = runner_data['batting_profile']['stealing_success_rate'] - (defensive_catcher['catchers_arm'] * 0.1)
-        if self.game_rng.random() < success_chance:
+        if self._rand() < success_chance:
             self.bases[base_to_steal - 1] = runner_name
             self.bases[base_from_idx] = None
 
@@ -781,21 +958,37 @@ class BaseballSimulator:
             return True # Caught stealing
 
     def _simulate_at_bat(self, batter, pitcher):
-        self._update_batting_stat(self._batting_team_key, batter['id'], 'plateAppearances')
+        # Stat updates run several times per pitch; bind the updaters and their keys once per at-bat
+        batting_key, pitching_key = self._batting_team_key, self._pitching_team_key
+        batter_id, pitcher_id = batter['id'], pitcher['id']
+        update_batting, update_pitching = self._update_batting_stat, self._update_pitching_stat
+        update_batting(batting_key, batter_id, 'plateAppearances')
         balls, strikes = 0, 0
         play_events: list[PlayEvent] = []
         
         # Boost HBP rate to match MLB averages
-        if self.game_rng.random() < (batter['plate_discipline'].get('HBP', 0) * 2.5):
+        if self._rand() < (batter['plate_discipline'].get('HBP', 0) * 2.5):
             # Advance time for the HBP pitch
             self.current_time += timedelta(seconds=self.time_rng.uniform(15.0, 25.0))
-            self._update_batting_stat(self._batting_team_key, batter['id'], 'hitByPitch')
-            self._update_pitching_stat(self._pitching_team_key, pitcher['id'], 'hitByPitch')
+            update_batting(batting_key, batter_id, 'hitByPitch')
+            update_pitching(pitching_key, pitcher_id, 'hitByPitch')
             return "Hit By Pitch", None, play_events
 
-        bunt_propensity = batter['batting_profile'].get('bunt_propensity', 0.0)
-        bunt_situation = self.outs < 2 and any(self.bases) and not self.bases[2]
-        is_bunting = bunt_situation and self.game_rng.random() < bunt_propensity
+        batting_profile = batter['batting_profile']
+        bunt_propensity = batting_profile.get('bunt_propensity', 0.0)
+        bunt_situation = self.outs < 2 and self.bases[2] is None and (self.bases[0] is not None or self.bases[1] is not None)
+        is_bunting = bunt_situation and self._rand() < bunt_propensity
+
+        # The batter and pitcher are fixed for the whole at-bat
+        contact_rate = batting_profile['contact'] + 0.063
+        swing_at_ball_prob = self._swing_at_ball_prob(batter)
+        pitch_around_penalty = self._pitch_around_penalty(batter)
+        arsenal_names, arsenal_cum, arsenal_total, arsenal_velo, arsenal_spin, arsenal_types = self._arsenal[pitcher['legal_name']]
+        arsenal_hi = len(arsenal_cum) - 1
+        pitch_counts = self.pitch_counts
+        pitcher_name, stamina = pitcher['legal_name'], pitcher['stamina']
+        # Every pitch is a ball or a strike for the pitcher's line; credit them once when the at-bat ends
+        pitch_count_before = pitch_counts[pitcher_name]
 
         while balls < 4 and strikes < 3:
             pitch_start_time = self.current_time.isoformat()
@@ -808,22 +1001,26 @@ class BaseballSimulator:
             pitch_outcome_text = ""
             steal_attempt_base = self._decide_steal_attempt(balls, strikes)
             
-            self.pitch_counts[pitcher['legal_name']] += 1
-            pitch_selection = self.game_rng.choices(list(pitcher['pitch_arsenal'].keys()), weights=[v['prob'] for v in pitcher['pitch_arsenal'].values()], k=1)[0]
-            pitch_details_team = pitcher['pitch_arsenal'][pitch_selection]
-            pitch_velo = round(self.game_rng.uniform(*pitch_details_team['velo_range']), 1)
-            pitch_spin = self.game_rng.randint(*pitch_details_team.get('spin_range', (2000, 2500))) if self.game_rng.random() > 0.08 else None
+            pitch_count = pitch_counts[pitcher_name] + 1
+            pitch_counts[pitcher_name] = pitch_count
+            # Same draw as choices(..., cum_weights=..., k=1) without its per-call setup
+            pitch_idx = bisect(arsenal_cum, self._rand() * arsenal_total, 0, arsenal_hi)
+            pitch_selection = arsenal_names[pitch_idx]
+            pitch_velo = round(self.game_rng.uniform(*arsenal_velo[pitch_idx]), 1)
+            pitch_spin = self.game_rng.randint(*arsenal_spin[pitch_idx]) if self._rand() > 0.08 else None
             
-            is_strike_loc, pitch_zone = self._simulate_pitch_trajectory(pitcher, batter)
+            # Control fades once the pitch count passes the pitcher's stamina
+            fatigue_penalty = ((pitch_count - stamina) / 15) * 0.1 if pitch_count > stamina else 0.0
+            is_strike_loc, pitch_zone = self._simulate_pitch_trajectory(pitcher, fatigue_penalty, pitch_around_penalty)
             
             pre_pitch_balls, pre_pitch_strikes = balls, strikes
             event_details: PlayEvent['details'] = {}
             is_in_play = False
             hit_result = None
 
-            swing = self._simulate_bat_swing(batter, is_strike_loc) or is_bunting
+            swing = self._simulate_bat_swing(is_strike_loc, swing_at_ball_prob) or is_bunting
             # Boost contact rate slightly to reduce strikeouts (adjusted to 0.063)
-            contact = self.game_rng.random() < (batter['batting_profile']['contact'] + 0.063) or (is_bunting and is_strike_loc)
+            contact = self._rand() < contact_rate or (is_bunting and is_strike_loc)
 
             play_event: PlayEvent = {
                 'index': self._pitch_event_seq,
@@ -835,27 +1032,13 @@ class BaseballSimulator:
             if is_bunting:
                 play_event['isBunt'] = True
 
-            if not swing:
-                if is_strike_loc:
-                    strikes += 1; pitch_outcome_text = "called strike"
-                    event_details = {'code': 'C', 'description': 'Called Strike', 'isStrike': True}
-                    self._update_pitching_stat(self._pitching_team_key, pitcher['id'], 'strikes')
-                else:
-                    balls += 1; pitch_outcome_text = "ball"
-                    event_details = {'code': 'B', 'description': 'Ball', 'isStrike': False}
-                    self._update_pitching_stat(self._pitching_team_key, pitcher['id'], 'balls')
-            else: # Swung or Bunting
-                if not contact:
-                    strikes += 1; pitch_outcome_text = "swinging strike"
-                    event_details = {'code': 'S', 'description': 'Swinging Strike', 'isStrike': True}
-                    self._update_pitching_stat(self._pitching_team_key, pitcher['id'], 'strikes')
-                else: # Contact
-                    is_foul = self.game_rng.random() < 0.6
-                    if is_foul:
+            # Arms are ordered by how often they occur: swings before takes, fouls before balls in play
+            if swing: # Swung or Bunting
+                if contact:
+                    if self._rand() < _FOUL_RATE:
                         if strikes < 2: strikes += 1
                         pitch_outcome_text = "foul"
                         event_details = {'code': 'F', 'description': 'Foul', 'isStrike': True}
-                        self._update_pitching_stat(self._pitching_team_key, pitcher['id'], 'strikes')
                         if is_bunting:
                             event_details['description'] = 'Foul Bunt'
                             if strikes == 3: # Foul bunt with 2 strikes is a strikeout
@@ -870,10 +1053,17 @@ class BaseballSimulator:
                             hit_result = self._determine_outcome_from_trajectory(batted_ball_data['ev'], batted_ball_data['la'])
                         pitch_outcome_text = "in play"
                         event_details = {'code': 'X', 'description': f'In play, {hit_result}', 'isStrike': True}
-                        self._update_pitching_stat(self._pitching_team_key, pitcher['id'], 'strikes')
+                else:
+                    strikes += 1; pitch_outcome_text = "swinging strike"
+                    event_details = {'code': 'S', 'description': 'Swinging Strike', 'isStrike': True}
+            elif not is_strike_loc:
+                balls += 1; pitch_outcome_text = "ball"
+                event_details = {'code': 'B', 'description': 'Ball', 'isStrike': False}
+            else:
+                strikes += 1; pitch_outcome_text = "called strike"
+                event_details = {'code': 'C', 'description': 'Called Strike', 'isStrike': True}
 
-            self._update_pitching_stat(self._pitching_team_key, pitcher['id'], 'numberOfPitches')
-            event_details['type'] = {'code': GAME_CONTEXT['PITCH_TYPE_MAP'].get(pitch_selection, 'UN'), 'description': pitch_selection.capitalize()}
+            event_details['type'] = arsenal_types[pitch_idx]
             event_details['zone'] = pitch_zone
 
             pitch_data: PitchData = {'startSpeed': pitch_velo, 'zone': pitch_zone}
@@ -893,13 +1083,8 @@ class BaseballSimulator:
                     'pitch_details': {'type': pitch_selection, 'velo': pitch_velo, 'spin': pitch_spin}
                 }
                 if 'ev' in batted_ball_data:
-                    hit_data: HitData = {
-                        'launchSpeed': batted_ball_data['ev'], 'launchAngle': batted_ball_data['la'],
-                        'trajectory': self._get_trajectory(hit_result, batted_ball_data.get('la'))
-                    }
-                    if hit_result in ["Single", "Double", "Triple", "Home Run"]:
-                        hit_data['location'] = self._determine_hit_location(hit_result, batted_ball_data['ev'], batted_ball_data['la'])
-                    play_events[-1]['hitData'] = hit_data
+                    play_events[-1]['hitData'] = self._build_hit_data(hit_result, batted_ball_data['ev'], batted_ball_data['la'])
+                self._credit_pitches(pitching_key, pitcher_id, pitch_counts[pitcher_name] - pitch_count_before, balls)
                 return hit_result, description_context, play_events
 
             # If the ball is not in play, now we resolve the steal attempt.
@@ -909,77 +1094,85 @@ class BaseballSimulator:
                 else:
                     caught_stealing = self._resolve_steal_attempt(steal_attempt_base, play_events, balls, strikes)
                     if caught_stealing and self.outs >= 3:
+                        self._credit_pitches(pitching_key, pitcher_id, pitch_counts[pitcher_name] - pitch_count_before, balls)
                         return "Caught Stealing", None, play_events
                     elif caught_stealing and strikes == 3:
                         # "Strike 'em out, throw 'em out" double play
                         self.outs += 1
-                        self._update_pitching_stat(self._pitching_team_key, pitcher['id'], 'outs')
-                        self._update_batting_stat(self._batting_team_key, batter['id'], 'strikeOuts')
-                        self._update_batting_stat(self._batting_team_key, batter['id'], 'atBats')
-                        self._update_pitching_stat(self._pitching_team_key, pitcher['id'], 'strikeOuts')
+                        update_pitching(pitching_key, pitcher_id, 'outs')
+                        update_batting(batting_key, batter_id, 'strikeOuts')
+                        update_batting(batting_key, batter_id, 'atBats')
+                        update_pitching(pitching_key, pitcher_id, 'strikeOuts')
+                        self._credit_pitches(pitching_key, pitcher_id, pitch_counts[pitcher_name] - pitch_count_before, balls)
                         return "Strikeout Double Play", None, play_events
 
         if balls == 4:
-            self._update_batting_stat(self._batting_team_key, batter['id'], 'baseOnBalls')
-            self._update_pitching_stat(self._pitching_team_key, pitcher['id'], 'baseOnBalls')
+            update_batting(batting_key, batter_id, 'baseOnBalls')
+            update_pitching(pitching_key, pitcher_id, 'baseOnBalls')
+            self._credit_pitches(pitching_key, pitcher_id, pitch_counts[pitcher_name] - pitch_count_before, balls)
             return "Walk", None, play_events
 
-        self._update_batting_stat(self._batting_team_key, batter['id'], 'strikeOuts')
-        self._update_batting_stat(self._batting_team_key, batter['id'], 'atBats')
-        self._update_pitching_stat(self._pitching_team_key, pitcher['id'], 'strikeOuts')
+        update_batting(batting_key, batter_id, 'strikeOuts')
+        update_batting(batting_key, batter_id, 'atBats')
+        update_pitching(pitching_key, pitcher_id, 'strikeOuts')
+        self._credit_pitches(pitching_key, pitcher_id, pitch_counts[pitcher_name] - pitch_count_before, balls)
         return "Strikeout", {}, play_events
 
 
     def _advance_runners(self, hit_type, batter, was_error=False, include_batter_advance=False):
+        """
+        Moves runners for a walk/HBP or base hit.
+        Advances are (runner_name, end_base) pairs, end_base being "1B", "2B", "3B" or "score".
+        """
         runs, rbis = 0, 0
         advances = []
         batter_name = batter['legal_name']
-        batter_gets_rbi = not was_error
-
-        if hit_type in ["Walk", "HBP"]:
-            new_bases = self.bases[:]
-            if new_bases[0]:
-                if new_bases[1]:
-                    if new_bases[2]: runs += 1; rbis += 1; advances.append(f"{new_bases[2]} scores")
-                    advances.append(f"{new_bases[1]} to 3B"); new_bases[2] = new_bases[1]
-                advances.append(f"{new_bases[0]} to 2B"); new_bases[1] = new_bases[0]
-            new_bases[0] = batter_name
-            self.bases = new_bases
+        batter_rbi = 0 if was_error else 1
+        r1, r2, r3 = self.bases
+
+        if hit_type in _WALK_TYPES:
+            if r1:
+                if r2:
+                    if r3: runs += 1; rbis += 1; advances.append((r3, "score"))
+                    advances.append((r2, "3B")); r3 = r2
+                advances.append((r1, "2B")); r2 = r1
+            self.bases[0], self.bases[1], self.bases[2] = batter_name, r2, r3
             return {'runs': runs, 'rbis': rbis, 'advances': advances}
 
-        old_bases = self.bases[:]
-        new_bases = [None, None, None]
+        new_r1, new_r2, new_r3 = None, None, None
         if hit_type == 'Single':
-            if old_bases[2]: runs += 1; rbis += (1 if batter_gets_rbi else 0); advances.append(f"{old_bases[2]} scores")
-            if old_bases[1]: new_bases[2] = old_bases[1]; advances.append(f"{old_bases[1]} to 3B")
-            if old_bases[0]: new_bases[1] = old_bases[0]; advances.append(f"{old_bases[0]} to 2B")
-            new_bases[0] = batter_name
-            if include_batter_advance: advances.append(f"{batter_name} to 1B")
+            if r3: runs += 1; rbis += batter_rbi; advances.append((r3, "score"))
+            if r2: new_r3 = r2; advances.append((r2, "3B"))
+            if r1: new_r2 = r1; advances.append((r1, "2B"))
+            new_r1 = batter_name
+            if include_batter_advance: advances.append((batter_name, "1B"))
         elif hit_type == 'Double':
-            if old_bases[2]: runs += 1; rbis += (1 if batter_gets_rbi else 0); advances.append(f"{old_bases[2]} scores")
-            if old_bases[1]: runs += 1; rbis += (1 if batter_gets_rbi else 0); advances.append(f"{old_bases[1]} scores")
-            if old_bases[0]: new_bases[2] = old_bases[0]; advances.append(f"{old_bases[0]} to 3B")
-            new_bases[1] = batter_name
-            if include_batter_advance: advances.append(f"{batter_name} to 2B")
+            if r3: runs += 1; rbis += batter_rbi; advances.append((r3, "score"))
+            if r2: runs += 1; rbis += batter_rbi; advances.append((r2, "score"))
+            if r1: new_r3 = r1; advances.append((r1, "3B"))
+            new_r2 = batter_name
+            if include_batter_advance: advances.append((batter_name, "2B"))
         elif hit_type == 'Triple':
-            for runner in old_bases:
-                if runner: runs += 1; rbis += (1 if batter_gets_rbi else 0); advances.append(f"{runner} scores")
-            new_bases[2] = batter_name
-            if include_batter_advance: advances.append(f"{batter_name} to 3B")
+            for runner in (r1, r2, r3):
+                if runner: runs += 1; rbis += batter_rbi; advances.append((runner, "score"))
+            new_r3 = batter_name
+            if include_batter_advance: advances.append((batter_name, "3B"))
         elif hit_type == 'Home Run':
-            for runner in old_bases:
-                if runner: runs += 1; rbis += 1; advances.append(f"{runner} scores")
-            runs += 1; rbis += 1; advances.append(f"{batter_name} scores")
+            for runner in (r1, r2, r3):
+                if runner: runs += 1; rbis += 1; advances.append((runner, "score"))
+            runs += 1; rbis += 1; advances.append((batter_name, "score"))
 
-        self.bases = new_bases
+        self.bases[0], self.bases[1], self.bases[2] = new_r1, new_r2, new_r3
         return {'runs': runs, 'rbis': rbis, 'advances': advances}
 
     def _get_bases_str(self):
+        r1, r2, r3 = self.bases
+        if not (r1 or r2 or r3): return "Bases empty"
         runners = []
-        if self.bases[2]: runners.append(f"3B: {self.bases[2]}")
-        if self.bases[1]: runners.append(f"2B: {self.bases[1]}")
-        if self.bases[0]: runners.append(f"1B: {self.bases[0]}")
-        return ", ".join(runners) if runners else "Bases empty"
+        if r3: runners.append(f"3B: {r3}")
+        if r2: runners.append(f"2B: {r2}")
+        if r1: runners.append(f"1B: {r1}")
+        return ", ".join(runners)
 
     def _manage_pitching_change(self):
         is_home_team_pitching = self.top_of_inning
@@ -1001,7 +1194,7 @@ class BaseballSimulator:
             'player': {
                 'id': player['id'],
                 'fullName': player['legal_name'],
-                'link': f"/api/v1/people/{player['id']}"
+                'link': self._person_links[player['id']]
             },
             'position': player['position'],
             'credit': credit_type
@@ -1036,28 +1229,31 @@ class BaseballSimulator:
         return credits_runner, credits_batter
 
     def _handle_batted_ball_out(self, out_type, batter, context=None):
-        defensive_team_prefix = 'team1' if self.top_of_inning else 'team2'
-        defense = getattr(self, f"{defensive_team_prefix}_defense")
-        infielders = getattr(self, f"{defensive_team_prefix}_infielders")
-        outfielders = getattr(self, f"{defensive_team_prefix}_outfielders")
-        pitcher = getattr(self, f"{defensive_team_prefix}_pitcher_stats")[getattr(self, f"{defensive_team_prefix}_current_pitcher_name")]
-        catcher = getattr(self, f"{defensive_team_prefix}_catcher")
+        fielding = self._fielding[0 if self.top_of_inning else 1]
+        defense = fielding['defense']
+        infielders = fielding['infielders']
+        outfielders = fielding['outfielders']
+        pitcher = fielding['pitcher_stats'][self.team1_current_pitcher_name if self.top_of_inning else self.team2_current_pitcher_name]
+        catcher = fielding['catcher']
         first_baseman = defense.get('1B')
 
         fielder, is_error, credits = None, False, []
         credits_runner, credits_batter = [], []
         batted_ball_data = context.get('batted_ball_data', {}) if context else {}
         
-        if out_type in ['Groundout', 'Sacrifice Bunt', 'Lineout', 'Pop Out', 'Forceout', 'Grounded Into DP', 'Double Play']:
-            grounder_candidates = [(p, 6) for p in infielders] + [(pitcher, 1)] + ([(catcher, 0.25)] if catcher else [])
-            fielder = self.game_rng.choices([c[0] for c in grounder_candidates], weights=[c[1] for c in grounder_candidates], k=1)[0]
+        if out_type in _INFIELD_OUT_TYPES:
+            # Same draw as choices(infielders + [pitcher, catcher], weights=...), without rebuilding the candidates
+            ground_cum = fielding['ground_cum']
+            idx = bisect(ground_cum, self._rand() * fielding['ground_total'], 0, len(ground_cum) - 1)
+            fielder = infielders[idx] if idx < len(infielders) else (pitcher if idx == len(infielders) else catcher)
             if fielder['position']['abbreviation'] == 'C' and 'ev' in batted_ball_data:
                 batted_ball_data['ev'], batted_ball_data['la'] = round(self.game_rng.uniform(50, 70), 1), round(self.game_rng.uniform(-45, -20), 1)
         elif out_type == 'Flyout' or out_type == 'Sac Fly':
-            fielder = self.game_rng.choices(outfielders + infielders, weights=[6] * len(outfielders) + [1] * len(infielders), k=1)[0]
+            fly_cum = fielding['fly_cum']
+            fielder = fielding['fly_candidates'][bisect(fly_cum, self._rand() * fielding['fly_total'], 0, len(fly_cum) - 1)]
 
         # Boost fielding slightly to reduce error rate to MLB levels
-        if fielder and self.game_rng.random() > fielder['fielding_ability'] * (self.team1_data if self.top_of_inning else self.team2_data)['fielding_prowess'] * 1.006:
+        if fielder and self._rand() > fielder['fielding_ability'] * fielding['fielding_prowess'] * 1.006:
             is_error = True
 
         if is_error:
@@ -1065,15 +1261,16 @@ class BaseballSimulator:
             return 0, True, 0, credits, [], [], False, "Field Error", None
 
         runs, rbis = 0, 0
-        if out_type in ['Flyout', 'Pop Out', 'Lineout']:
+        r1, r2, r3 = self.bases
+        if out_type in _AIR_OUT_TYPES:
             fielder_pos = fielder['position']['abbreviation']
             credits.append(self._create_credit(fielder, 'putout'))
 
             # Sac Fly logic
-            if self.outs < 2 and self.bases[2] and fielder_pos in ['LF', 'CF', 'RF'] and self.game_rng.random() > 0.15:
+            if self.outs < 2 and r3 and fielder_pos in _OUTFIELD_POSITIONS and self._rand() > 0.15:
                 self.outs += 1
                 runs, rbis = 1, 1
-                runner_on_third, self.bases[2] = self.bases[2], None
+                self.bases[2] = None
                 specific_event = "Sac Fly"
                 return runs, False, rbis, credits, [], [], False, specific_event, None
             else:
@@ -1081,18 +1278,18 @@ class BaseballSimulator:
                 specific_event = out_type
                 return runs, False, rbis, credits, [], [], False, specific_event, None
 
-        if out_type == 'Groundout' or out_type == 'Grounded Into DP' or out_type == 'Double Play':
+        if out_type in _GROUND_OUT_TYPES:
             is_dp = False
-            if out_type == 'Grounded Into DP' or out_type == 'Double Play':
+            if out_type in _DOUBLE_PLAY_TYPES:
                 is_dp = True
-            elif self.outs < 2 and self.bases[0] and self.game_rng.random() < self.team1_data['double_play_rate']:
+            elif self.outs < 2 and r1 and self._rand() < fielding['double_play_rate']:
                 is_dp = True
 
-            if is_dp and self.outs < 2 and self.bases[0]:
-                runner_out = self.bases[0]
+            if is_dp and self.outs < 2 and r1:
+                runner_out = r1
                 self.outs += 2
-                self.bases[0] = None
-                if self.bases[1]: self.bases[2], self.bases[1] = self.bases[1], None
+                if r2: r3, r2 = r2, None
+                self.bases[0], self.bases[1], self.bases[2] = None, r2, r3
 
                 credits_runner, credits_batter = self._get_double_play_participants(fielder, defense)
 
@@ -1104,7 +1301,7 @@ class BaseballSimulator:
             # Check for force play situation (not a double play)
             is_force_play = False
             force_base = None
-            if self.bases[0] and not self.bases[1] and self.game_rng.random() < 0.5:
+            if r1 and not r2 and self._rand() < 0.5:
                 is_force_play = True
                 force_base = "2B"
 
@@ -1113,15 +1310,16 @@ class BaseballSimulator:
                 self.bases[0] = batter['legal_name']  # Batter reaches
                 if force_base == "2B":
                     self.bases[1] = None # Runner forced at second
-                ss = getattr(self, f"{defensive_team_prefix}_defense").get('SS')
+                ss = defense.get('SS')
                 credits = [self._create_credit(fielder, 'assist'), self._create_credit(ss, 'putout')]
                 return 0, False, 0, credits, [], [], False, "Forceout", None
 
             self.outs += 1
             if self.outs < 3:
-                if self.bases[2]: runs, rbis, self.bases[2] = 1, 1, None
-                if self.bases[1]: self.bases[2], self.bases[1] = self.bases[1], None
-                if self.bases[0]: self.bases[1], self.bases[0] = self.bases[0], None
+                if r3: runs, rbis, r3 = 1, 1, None
+                if r2: r3, r2 = r2, None
+                if r1: r2, r1 = r1, None
+                self.bases[0], self.bases[1], self.bases[2] = r1, r2, r3
             else:
                 runs, rbis = 0, 0
             specific_event = "Groundout"
@@ -1129,15 +1327,14 @@ class BaseballSimulator:
         elif out_type == 'Sacrifice Bunt':
             runners_advanced = False
             self.outs += 1
-            if self.outs < 3 and any(self.bases):
-                new_bases = self.bases[:]
-                if new_bases[1]:
-                    new_bases[2], new_bases[1] = new_bases[1], None
+            if self.outs < 3 and (r1 or r2 or r3):
+                if r2:
+                    r3, r2 = r2, None
                     runners_advanced = True
-                if new_bases[0]:
-                    new_bases[1], new_bases[0] = new_bases[0], None
+                if r1:
+                    r2, r1 = r1, None
                     runners_advanced = True
-                self.bases = new_bases
+                self.bases[0], self.bases[1], self.bases[2] = r1, r2, r3
 
             final_out_type = "Sacrifice Bunt" if runners_advanced else "Bunt Ground Out"
             if final_out_type == "Sacrifice Bunt":
@@ -1154,10 +1351,24 @@ class BaseballSimulator:
     def _simulate_half_inning(self):
         self.outs, self.bases = 0, [None, None, None]
         is_home_team_batting = not self.top_of_inning
-        batting_team_name, lineup, batter_idx_ref = (self.team1_name, self.team1_lineup, 'team1_batter_idx') if is_home_team_batting else (self.team2_name, self.team2_lineup, 'team2_batter_idx')
+        side = 0 if is_home_team_batting else 1
+        offense = self._offense[side]
+        lineup = offense['lineup']
+        pitcher_stats = self._fielding[1 - side]['pitcher_stats']
+
+        # Side-dependent keys for this half-inning; batting_key/fielding_key double as the boxscore team keys
+        batting_key, fielding_key = ('home', 'away') if is_home_team_batting else ('away', 'home')
+        half_inning = "bottom" if is_home_team_batting else "top"
+
+        # Linescore entries this half-inning updates, bound once instead of re-walked every play
+        linescore = self._linescore
+        inning_line = linescore['innings'][self.inning - 1][batting_key]
+        batting_line, fielding_line = linescore['teams'][batting_key], linescore['teams'][fielding_key]
+        emit_play = self._emit_play
+        update_batting, update_pitching, update_fielding = self._update_batting_stat, self._update_pitching_stat, self._update_fielding_stat
 
         if self.inning >= 10:
-            last_batter_idx = (getattr(self, batter_idx_ref) - 1 + 9) % 9
+            last_batter_idx = (offense['batter_idx'] - 1 + 9) % 9
             runner_name = lineup[last_batter_idx]['legal_name']
             self.bases[1] = runner_name
             # Note: Renderer handles "Automatic runner" text
@@ -1172,13 +1383,17 @@ class BaseballSimulator:
             ab_start_time = self.current_time.isoformat()
 
             old_outs = self.outs
-            self._manage_pitching_change()
             pitcher_name = self.team1_current_pitcher_name if self.top_of_inning else self.team2_current_pitcher_name
-            pitcher = (self.team1_pitcher_stats if self.top_of_inning else self.team2_pitcher_stats)[pitcher_name]
-            batter = lineup[getattr(self, batter_idx_ref)]
+            # The bullpen only comes into play once the pitch count passes the current pitcher's stamina
+            if self.pitch_counts[pitcher_name] > pitcher_stats[pitcher_name]['stamina']:
+                self._manage_pitching_change()
+                pitcher_name = self.team1_current_pitcher_name if self.top_of_inning else self.team2_current_pitcher_name
+            pitcher = pitcher_stats[pitcher_name]
+            batter = lineup[offense['batter_idx']]
+            batter_name = batter['legal_name']
 
-            # Store pre-play base state for matchup
-            pre_play_bases = self.bases[:]
+            # Store pre-play base state for matchup (read-only, so a tuple snapshot)
+            pre_play_bases = tuple(self.bases)
 
             outcome, description, play_events = self._simulate_at_bat(batter, pitcher)
 
@@ -1193,12 +1408,12 @@ class BaseballSimulator:
             credits_batter_dp = []
 
             # Store pre-advance base state
-            old_bases = self.bases[:]
+            old_bases = tuple(self.bases)
 
             if outcome == "Caught Stealing":
-                self._update_pitching_stat(self._pitching_team_key, pitcher['id'], 'outs')
+                update_pitching(fielding_key, pitcher['id'], 'outs')
                 pass
-            elif outcome in ["Groundout", "Flyout", "Sacrifice Bunt", "Lineout", "Pop Out", "Forceout", "Grounded Into DP", "Bunt Ground Out", "Double Play"]:
+            elif outcome in _BATTED_OUT_TYPES:
                 result = self._handle_batted_ball_out(outcome, batter, description)
                 new_runs, was_error, new_rbis, credits_from_out, credits_batter_dp, credits_runner_dp, is_dp, specific_event, runner_out_dp = result
 
@@ -1209,11 +1424,11 @@ class BaseballSimulator:
 
                 for credit in stats_credits:
                     if credit['credit'] == 'putout':
-                        self._update_fielding_stat(self._pitching_team_key, credit['player']['id'], 'putOuts')
+                        update_fielding(fielding_key, credit['player']['id'], 'putOuts')
                     elif credit['credit'] == 'assist':
-                        self._update_fielding_stat(self._pitching_team_key, credit['player']['id'], 'assists')
+                        update_fielding(fielding_key, credit['player']['id'], 'assists')
                     elif credit['credit'] == 'fielding_error':
-                        self._update_fielding_stat(self._pitching_team_key, credit['player']['id'], 'errors')
+                        update_fielding(fielding_key, credit['player']['id'], 'errors')
 
                 # If the catcher grounded out logic changed the batted ball data, update the event
                 # The 'X' event is the last one in play_events
@@ -1254,12 +1469,12 @@ class BaseballSimulator:
 
                 # Pitching Outs
                 outs_on_play = self.outs - old_outs
-                self._update_pitching_stat(self._pitching_team_key, pitcher['id'], 'outs', outs_on_play)
+                update_pitching(fielding_key, pitcher['id'], 'outs', outs_on_play)
 
-                if 'Ground' in outcome or 'DP' in outcome or 'Forceout' in outcome or 'Bunt' in outcome or 'Double Play' in outcome:
-                     self._update_pitching_stat(self._pitching_team_key, pitcher['id'], 'groundOuts', outs_on_play)
+                if outcome in _PITCHER_GROUND_OUT_TYPES:
+                     update_pitching(fielding_key, pitcher['id'], 'groundOuts', outs_on_play)
                 else:
-                     self._update_pitching_stat(self._pitching_team_key, pitcher['id'], 'airOuts', outs_on_play)
+                     update_pitching(fielding_key, pitcher['id'], 'airOuts', outs_on_play)
 
                 play_description_text = ""
                 if was_error:
@@ -1267,11 +1482,11 @@ class BaseballSimulator:
                     adv_info = self._advance_runners("Single", batter, was_error=True, include_batter_advance=True)
                     runs += adv_info['runs']
                     advances.extend(adv_info['advances'])
-                    self._update_batting_stat(self._batting_team_key, batter['id'], 'atBats')
+                    update_batting(batting_key, batter['id'], 'atBats')
                 elif is_dp:
                     outcome = "Double Play"
-                    self._update_batting_stat(self._batting_team_key, batter['id'], 'atBats')
-                    self._update_batting_stat(self._batting_team_key, batter['id'], 'groundIntoDoublePlay')
+                    update_batting(batting_key, batter['id'], 'atBats')
+                    update_batting(batting_key, batter['id'], 'groundIntoDoublePlay')
 
                     # Generate DP description
                     # "shortstop X to second baseman Y to first baseman Z"
@@ -1292,100 +1507,100 @@ class BaseballSimulator:
                             participants.append(f"{pos_name} {player_name}")
                             last_player_id = player_id
 
-                    play_description_text = f"{batter['legal_name']} grounds into a double play, {' to '.join(participants)}."
+                    play_description_text = f"{batter_name} grounds into a double play, {' to '.join(participants)}."
                     # Add runner out details
                     # "RunnerName out at 2nd. BatterName out at 1st."
-                    play_description_text += f" {runner_out_dp} out at 2nd. {batter['legal_name']} out at 1st."
+                    play_description_text += f" {runner_out_dp} out at 2nd. {batter_name} out at 1st."
 
                 elif "Sacrifice Bunt" in specific_event:
-                    self._update_batting_stat(self._batting_team_key, batter['id'], 'sacBunts')
+                    update_batting(batting_key, batter['id'], 'sacBunts')
                     outcome = specific_event
                 elif "Sac Fly" in specific_event:
-                    self._update_batting_stat(self._batting_team_key, batter['id'], 'sacFlies')
+                    update_batting(batting_key, batter['id'], 'sacFlies')
                     outcome = specific_event
                 else: # Generic Out
                     outcome = specific_event
-                    self._update_batting_stat(self._batting_team_key, batter['id'], 'atBats')
+                    update_batting(batting_key, batter['id'], 'atBats')
                     if "Ground" in outcome or "Forceout" in outcome:
-                        self._update_batting_stat(self._batting_team_key, batter['id'], 'groundOuts')
+                        update_batting(batting_key, batter['id'], 'groundOuts')
                     else:
-                        self._update_batting_stat(self._batting_team_key, batter['id'], 'flyOuts')
+                        update_batting(batting_key, batter['id'], 'flyOuts')
 
             elif outcome == "Strikeout":
                 self.outs += 1
-                self._update_pitching_stat(self._pitching_team_key, pitcher['id'], 'outs')
+                update_pitching(fielding_key, pitcher['id'], 'outs')
             elif outcome == "Strikeout Double Play":
-                self._update_pitching_stat(self._pitching_team_key, pitcher['id'], 'outs') # CS out is separate?
+                update_pitching(fielding_key, pitcher['id'], 'outs') # CS out is separate?
                 pass # Outs handled
-            elif outcome in ["Single", "Double", "Triple", "Home Run", "Walk", "HBP"]:
+            elif outcome in _ADVANCE_TYPES:
                 adv_info = self._advance_runners(outcome, batter)
                 runs += adv_info['runs']; rbis += adv_info['rbis']; advances.extend(adv_info['advances'])
-                if outcome in ["Single", "Double", "Triple", "Home Run"]:
-                    self._update_batting_stat(self._batting_team_key, batter['id'], 'hits')
-                    self._update_batting_stat(self._batting_team_key, batter['id'], 'atBats')
-                    self._update_batting_stat(self._batting_team_key, batter['id'], 'totalBases', {"Single": 1, "Double": 2, "Triple": 3, "Home Run": 4}[outcome])
-                    self._update_pitching_stat(self._pitching_team_key, pitcher['id'], 'hits')
-                    if outcome == "Double": self._update_batting_stat(self._batting_team_key, batter['id'], 'doubles'); self._update_pitching_stat(self._pitching_team_key, pitcher['id'], 'doubles')
-                    if outcome == "Triple": self._update_batting_stat(self._batting_team_key, batter['id'], 'triples'); self._update_pitching_stat(self._pitching_team_key, pitcher['id'], 'triples')
-                    if outcome == "Home Run": self._update_batting_stat(self._batting_team_key, batter['id'], 'homeRuns'); self._update_pitching_stat(self._pitching_team_key, pitcher['id'], 'homeRuns')
-
-            if is_home_team_batting: self.team1_score += runs
-            else: self.team2_score += runs
+                if outcome in _HIT_TYPES:
+                    update_batting(batting_key, batter['id'], 'hits')
+                    update_batting(batting_key, batter['id'], 'atBats')
+                    total_bases, extra_base_stat = _HIT_STATS[outcome]
+                    update_batting(batting_key, batter['id'], 'totalBases', total_bases)
+                    update_pitching(fielding_key, pitcher['id'], 'hits')
+                    if extra_base_stat:
+                        update_batting(batting_key, batter['id'], extra_base_stat)
+                        update_pitching(fielding_key, pitcher['id'], extra_base_stat)
+
+            self._scores[side] += runs
 
             if rbis > 0:
-                 self._update_batting_stat(self._batting_team_key, batter['id'], 'rbi', rbis)
+                 update_batting(batting_key, batter['id'], 'rbi', rbis)
 
             # Pitching Runs
             if runs > 0:
-                 self._update_pitching_stat(self._pitching_team_key, pitcher['id'], 'runs', runs)
+                 update_pitching(fielding_key, pitcher['id'], 'runs', runs)
                  # Earned runs? Simplifying to all earned for now
                  if not was_error:
-                      self._update_pitching_stat(self._pitching_team_key, pitcher['id'], 'earnedRuns', runs)
+                      update_pitching(fielding_key, pitcher['id'], 'earnedRuns', runs)
 
             play_index = len(play_events) - 1 if play_events else 0
-            base_map = {0: "1B", 1: "2B", 2: "3B"}
+            event_type_code = self._get_event_type_code(outcome)
 
             # --- Runner tracking logic ---
 
-            if outcome in ["Single", "Double", "Triple", "Home Run"]:
+            if outcome in _HIT_TYPES:
                 for base_idx, runner_name in enumerate(old_bases):
                     if runner_name:
-                        origin = base_map[base_idx]
+                        origin = _BASE_LABELS[base_idx]
                         scored = runner_name not in self.bases
-                        end = "score" if scored else base_map[self.bases.index(runner_name)]
+                        end = "score" if scored else _BASE_LABELS[self.bases.index(runner_name)]
                         runner_entry = self._build_runner_entry(
                             runner_name=runner_name, origin_base=origin, end_base=end,
                             is_out=False, out_number=None, event=outcome,
-                            event_type=self._get_event_type_code(outcome),
+                            event_type=event_type_code,
                             movement_reason="r_adv_play", play_index=play_index,
                             is_scoring=scored, is_rbi=scored and not was_error,
                             responsible_pitcher=pitcher if scored else None
                         )
                         if runner_entry: runner_list.append(runner_entry)
 
-                batter_end = {"Single": "1B", "Double": "2B", "Triple": "3B", "Home Run": "score"}[outcome]
+                batter_end = _HIT_BATTER_END[outcome]
                 batter_scored = outcome == "Home Run"
                 batter_entry = self._build_runner_entry(
-                    runner_name=batter['legal_name'], origin_base=None, end_base=batter_end,
+                    runner_name=batter_name, origin_base=None, end_base=batter_end,
                     is_out=False, out_number=None, event=outcome,
-                    event_type=self._get_event_type_code(outcome),
+                    event_type=event_type_code,
                     movement_reason=None, play_index=play_index,
                     is_scoring=batter_scored, is_rbi=batter_scored,
                     responsible_pitcher=pitcher if batter_scored else None
                 )
                 if batter_entry: runner_list.append(batter_entry)
 
-            elif outcome in ["Walk", "HBP"]:
+            elif outcome in _WALK_TYPES:
                 for base_idx, runner_name in enumerate(old_bases):
                     if runner_name:
-                        origin = base_map[base_idx]
+                        origin = _BASE_LABELS[base_idx]
                         scored = runner_name not in self.bases
-                        end = "score" if scored else base_map[self.bases.index(runner_name)]
+                        end = "score" if scored else _BASE_LABELS[self.bases.index(runner_name)]
                         was_forced = (base_idx == 0) or (base_idx == 1 and old_bases[0]) or (base_idx == 2 and old_bases[0] and old_bases[1])
                         runner_entry = self._build_runner_entry(
                             runner_name=runner_name, origin_base=origin, end_base=end,
                             is_out=False, out_number=None, event=outcome,
-                            event_type=self._get_event_type_code(outcome),
+                            event_type=event_type_code,
                             movement_reason="r_adv_force" if was_forced else "r_adv_play",
                             play_index=play_index,
                             is_scoring=scored, is_rbi=scored,
@@ -1394,15 +1609,15 @@ class BaseballSimulator:
                         if runner_entry: runner_list.append(runner_entry)
 
                 batter_entry = self._build_runner_entry(
-                    runner_name=batter['legal_name'], origin_base=None, end_base="1B",
+                    runner_name=batter_name, origin_base=None, end_base="1B",
                     is_out=False, out_number=None, event=outcome,
-                    event_type=self._get_event_type_code(outcome),
+                    event_type=event_type_code,
                     movement_reason=None, play_index=play_index,
                     is_scoring=False, is_rbi=False
                 )
                 if batter_entry: runner_list.append(batter_entry)
 
-            elif outcome in ["Groundout", "Flyout", "Sacrifice Bunt", "Lineout", "Pop Out", "Forceout", "Grounded Into DP", "Bunt Ground Out", "Sac Fly", "Field Error", "Double Play"]:
+            elif outcome in _OUT_PLAY_TYPES:
                 if is_dp:
                     # Runner out at second
                     runner_entry = self._build_runner_entry(
@@ -1417,7 +1632,7 @@ class BaseballSimulator:
 
                     # Batter out at first
                     batter_entry = self._build_runner_entry(
-                        runner_name=batter['legal_name'], origin_base=None, end_base="1B",
+                        runner_name=batter_name, origin_base=None, end_base="1B",
                         is_out=True, out_number=self.outs, event="Grounded Into DP",
                         event_type="grounded_into_double_play",
                         movement_reason=None, play_index=play_index,
@@ -1428,26 +1643,26 @@ class BaseballSimulator:
                     # Handle runners who advanced, scored, or were out on a force
                     for base_idx, runner_name in enumerate(old_bases):
                         if runner_name:
-                            origin = base_map[base_idx]
-                            scored = runner_name not in self.bases and runner_name not in [b for b in self.bases if b]
+                            origin = _BASE_LABELS[base_idx]
                             advanced = runner_name in self.bases
+                            scored = not advanced
 
                             if scored:
                                 runner_entry = self._build_runner_entry(
                                     runner_name=runner_name, origin_base=origin, end_base="score",
                                     is_out=False, out_number=None, event=outcome,
-                                    event_type=self._get_event_type_code(outcome),
+                                    event_type=event_type_code,
                                     movement_reason="r_sac_fly" if "Sac Fly" in outcome else "r_adv_play",
                                     play_index=play_index, is_scoring=True, is_rbi=True and not was_error,
                                     responsible_pitcher=pitcher
                                 )
                                 if runner_entry: runner_list.append(runner_entry)
                             elif advanced:
-                                end = base_map[self.bases.index(runner_name)]
+                                end = _BASE_LABELS[self.bases.index(runner_name)]
                                 runner_entry = self._build_runner_entry(
                                     runner_name=runner_name, origin_base=origin, end_base=end,
                                     is_out=False, out_number=None, event=outcome,
-                                    event_type=self._get_event_type_code(outcome),
+                                    event_type=event_type_code,
                                     movement_reason="r_adv_play", play_index=play_index,
                                     is_scoring=False, is_rbi=False
                                 )
@@ -1456,9 +1671,9 @@ class BaseballSimulator:
                     # Batter's outcome (out or reached on error)
                     batter_reaches = was_error
                     batter_entry = self._build_runner_entry(
-                        runner_name=batter['legal_name'], origin_base=None, end_base="1B",
+                        runner_name=batter_name, origin_base=None, end_base="1B",
                         is_out=not batter_reaches, out_number=self.outs if not batter_reaches else None,
-                        event=outcome, event_type=self._get_event_type_code(outcome),
+                        event=outcome, event_type=event_type_code,
                         movement_reason=None, play_index=play_index,
                         is_scoring=False, is_rbi=False, credits=credits
                     )
@@ -1466,9 +1681,9 @@ class BaseballSimulator:
 
             elif outcome == "Strikeout":
                 batter_entry = self._build_runner_entry(
-                    runner_name=batter['legal_name'], origin_base=None, end_base=None,
+                    runner_name=batter_name, origin_base=None, end_base=None,
                     is_out=True, out_number=self.outs, event=outcome,
-                    event_type=self._get_event_type_code(outcome),
+                    event_type=event_type_code,
                     movement_reason=None, play_index=play_index,
                     is_scoring=False, is_rbi=False, credits=credits
                 )
@@ -1481,7 +1696,7 @@ class BaseballSimulator:
                  for i, (old, new) in enumerate(zip(old_bases, self.bases)):
                      if old and not new:
                          # This runner disappeared.
-                         origin = base_map[i]
+                         origin = _BASE_LABELS[i]
                          out_base = "2B" if origin == "1B" else "3B" # Assumption
                          # Wait, steal attempt.
                          # If caught stealing 2nd, origin 1B.
@@ -1503,58 +1718,48 @@ class BaseballSimulator:
             for runner_entry in runner_list:
                 if runner_entry['details']['isScoringEvent']:
                      runner_id = runner_entry['details']['runner']['id']
-                     self._update_batting_stat(self._batting_team_key, runner_id, 'runs')
+                     update_batting(batting_key, runner_id, 'runs')
 
             if runs > 0:
-                current_inning_idx = self.inning - 1
-                if is_home_team_batting:
-                    self.gameday_data['liveData']['linescore']['innings'][current_inning_idx]['home']['runs'] += runs
-                else:
-                    self.gameday_data['liveData']['linescore']['innings'][current_inning_idx]['away']['runs'] += runs
+                inning_line['runs'] += runs
 
-            at_bat_index = len(self.gameday_data['liveData']['plays']['allPlays'])
+            at_bat_index = self._at_bat_index
+            self._at_bat_index += 1
 
             final_description = play_description_text if is_dp and play_description_text else ""
 
-            play_result = PlayResult(type="atBat", event=outcome, eventType=self._get_event_type_code(outcome), description=final_description, rbi=rbis, awayScore=self.team2_score, homeScore=self.team1_score)
-            play_about = PlayAbout(atBatIndex=at_bat_index, halfInning="bottom" if is_home_team_batting else "top", isTopInning=not is_home_team_batting, inning=self.inning, isScoringPlay=runs > 0, startTime=ab_start_time, endTime=ab_end_time)
-            final_count = PlayCount(balls=0, strikes=0, outs=self.outs)
+            play_result: PlayResult = {"type": "atBat", "event": outcome, "eventType": event_type_code, "description": final_description, "rbi": rbis, "awayScore": self._scores[1], "homeScore": self._scores[0]}
+            play_about: PlayAbout = {"atBatIndex": at_bat_index, "halfInning": half_inning, "isTopInning": not is_home_team_batting, "inning": self.inning, "isScoringPlay": runs > 0, "startTime": ab_start_time, "endTime": ab_end_time}
+            final_count: PlayCount = {"balls": 0, "strikes": 0, "outs": self.outs}
             matchup = self._build_matchup(batter, pitcher, pre_play_bases)
-            current_lineup = self.team1_lineup if is_home_team_batting else self.team2_lineup
-
-            if self.bases[0]:
-                runner_obj = next((p for p in current_lineup if p['legal_name'] == self.bases[0]), None)
-                if runner_obj: matchup['postOnFirst'] = { "id": runner_obj['id'], "fullName": runner_obj['legal_name'], "link": f"/api/v1/people/{runner_obj['id']}" }
-            if self.bases[1]:
-                runner_obj = next((p for p in current_lineup if p['legal_name'] == self.bases[1]), None)
-                if runner_obj: matchup['postOnSecond'] = { "id": runner_obj['id'], "fullName": runner_obj['legal_name'], "link": f"/api/v1/people/{runner_obj['id']}" }
-            if self.bases[2]:
-                runner_obj = next((p for p in current_lineup if p['legal_name'] == self.bases[2]), None)
-                if runner_obj: matchup['postOnThird'] = { "id": runner_obj['id'], "fullName": runner_obj['legal_name'], "link": f"/api/v1/people/{runner_obj['id']}" }
+            lineup_by_name = offense['lineup_by_name']
+
+            for runner_name, post_key in zip(self.bases, _POST_ON_BASE_KEYS):
+                if runner_name:
+                    runner_obj = lineup_by_name.get(runner_name)
+                    if runner_obj: matchup[post_key] = { "id": runner_obj['id'], "fullName": runner_obj['legal_name'], "link": self._person_links[runner_obj['id']] }
 
             play_data: Play = {"result": play_result, "about": play_about, "count": final_count, "matchup": matchup, "playEvents": play_events, "runners": runner_list}
-            self.gameday_data['liveData']['plays']['allPlays'].append(play_data)
-
-            ls = self.gameday_data['liveData']['linescore']
-            ls['outs'] = self.outs
-            ls['teams']['home']['runs'] = self.team1_score
-            ls['teams']['away']['runs'] = self.team2_score
-            if outcome in ["Single", "Double", "Triple", "Home Run"]:
-                if is_home_team_batting: ls['teams']['home']['hits'] += 1
-                else: ls['teams']['away']['hits'] += 1
+            emit_play(play_data)
+
+            linescore['outs'] = self.outs
+            batting_line['runs'] = self._scores[side]
+            if outcome in _HIT_TYPES:
+                batting_line['hits'] += 1
             if was_error:
-                if is_home_team_batting: ls['teams']['away']['errors'] += 1
-                else: ls['teams']['home']['errors'] += 1
+                fielding_line['errors'] += 1
             
-            setattr(self, batter_idx_ref, (getattr(self, batter_idx_ref) + 1) % 9)
+            offense['batter_idx'] = (offense['batter_idx'] + 1) % 9
             if self.outs >= 3: break
-            if is_home_team_batting and self.team1_score > self.team2_score and self.inning >= 9:
-                return
+            if is_home_team_batting and self._scores[0] > self._scores[1] and self.inning >= 9:
+                break
 
-    def play_game(self):
-        should_continue = lambda: (self.inning <= 9 or self.team1_score == self.team2_score) if self.max_innings is None else self.inning <= self.max_innings
+        # Outs only change while a side is in the field, so the fielding side's lines are current from here on
+        self._format_innings_pitched(fielding_key)
 
-        while should_continue():
+    def play_game(self):
+        # Regulation plus extras while tied, or exactly max_innings when capped
+        while (self.inning <= 9 or self._scores[0] == self._scores[1]) if self.max_innings is None else self.inning <= self.max_innings:
             # Break between innings (or start of game logic)
             if self.inning > 1:
                 # Inning break (avg ~119.6s)
@@ -1564,7 +1769,7 @@ class BaseballSimulator:
             self._simulate_half_inning()
 
             # Fix logic: If middle of >=9th inning and Home (Team 1) is ahead, game over.
-            if self.inning >= 9 and self.team1_score > self.team2_score:
+            if self.inning >= 9 and self._scores[0] > self._scores[1]:
                 break
 
             if self.max_innings and self.inning >= self.max_innings:
@@ -1576,15 +1781,71 @@ class BaseballSimulator:
             self.top_of_inning = False
             self._simulate_half_inning()
 
-            if self.inning >= 9 and not self.top_of_inning and self.team1_score > self.team2_score:
+            if self.inning >= 9 and not self.top_of_inning and self._scores[0] > self._scores[1]:
                 break
 
             if self.max_innings and self.inning >= self.max_innings:
                 break
 
             self.inning += 1
-            self.gameday_data['liveData']['linescore']['currentInning'] = self.inning
-            self.gameday_data['liveData']['linescore']['innings'].append({'num': self.inning, 'home': {'runs': 0}, 'away': {'runs': 0}})
+            self._linescore['currentInning'] = self.inning
+            self._linescore['innings'].append({'num': self.inning, 'home': {'runs': 0}, 'away': {'runs': 0}})
+
+
+class JsonPlayWriter:
+    """
+    A play_sink that writes plays to a file-like stream as one JSON array, play by play,
+    so a game's plays never have to be held in memory. Call finalize() after the game to close the array.
+    Extra keyword arguments (e.g. indent) are passed to json.dump for each play.
+    """
+
+    def __init__(self, stream, **dump_kwargs):
+        self._stream = stream
+        self._dump_kwargs = dump_kwargs
+        self._count = 0
+        stream.write("[")
+
+    def __call__(self, play):
+        self._stream.write(",\n" if self._count else "\n")
+        json.dump(play, self._stream, **self._dump_kwargs)
+        self._count += 1
+
+    def finalize(self):
+        self._stream.write("\n]" if self._count else "]")
+
+
+def _play_seeded_game(team1_data, team2_data, game_seed, max_innings):
+    game = BaseballSimulator(team1_data, team2_data, max_innings=max_innings, game_seed=game_seed)
+    game.play_game()
+    return game.gameday_data
+
+
+# Rosters for simulate_games worker processes, sent once per worker rather than with every seed
+_worker_game_args = None
+
+
+def _init_game_worker(team1_data, team2_data, max_innings):
+    global _worker_game_args
+    _worker_game_args = (team1_data, team2_data, max_innings)
+
+
+def _play_worker_game(game_seed):
+    team1_data, team2_data, max_innings = _worker_game_args
+    return _play_seeded_game(team1_data, team2_data, game_seed, max_innings)
+
+
+def simulate_games(team1_data, team2_data, game_seeds, max_innings=None, processes=None):
+    """
+    Simulates one game per seed for Monte Carlo style workloads.
+    Returns the Gameday data of each game, in the same order as game_seeds.
+    Games are independent, so with processes > 1 they are spread over a multiprocessing pool;
+    each game depends only on its seed, so the results match a sequential run.
+    """
+    if processes is None or processes <= 1:
+        return [_play_seeded_game(team1_data, team2_data, game_seed, max_innings) for game_seed in game_seeds]
+
+    with multiprocessing.Pool(processes, initializer=_init_game_worker, initargs=(team1_data, team2_data, max_innings)) as pool:
+        return pool.map(_play_worker_game, game_seeds)
 
 
 if __name__ == "__main__":
@@ -1623,12 +1884,13 @@ if __name__ == "__main__":
                 if isinstance(obj, datetime): return obj.isoformat()
                 return super().default(obj)
 
-        gameday_json = json.dumps(gameday_data, indent=2, cls=DateTimeEncoder)
+        # Serialize only when there is somewhere to send it, streaming straight to the destination
         if args.gameday_outfile:
             with open(args.gameday_outfile, 'w') as f:
-                f.write(gameday_json)
+                json.dump(gameday_data, f, indent=2, cls=DateTimeEncoder)
         elif args.commentary == 'gameday':
-            print(gameday_json)
+            json.dump(gameday_data, sys.stdout, indent=2, cls=DateTimeEncoder)
+            print()
 
     # 3. Output Commentary (PBP or Statcast)
     output_text = ""
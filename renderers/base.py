@@ -26,6 +26,10 @@ class GameRenderer:
         self.away_team = gameday_data['gameData']['teams']['away']
         self.current_pitcher_info = {'home': None, 'away': None}
 
+        # Phrase tables are static; bind them once rather than walking GAME_CONTEXT per play.
+        self._statcast_verbs = GAME_CONTEXT['statcast_verbs']
+        self._strikeout_verbs = {k_type: tuple(phrases) for k_type, phrases in self._statcast_verbs['Strikeout'].items()}
+
     def _reseed_from_timestamp(self, time_str: str, salt: str = ""):
         if not time_str:
             return
@@ -114,7 +118,7 @@ class GameRenderer:
         return cat
 
     def _get_batted_ball_verb(self, outcome, cat, force_type=None):
-        outcome_data = GAME_CONTEXT['statcast_verbs'].get(outcome, {})
+        outcome_data = self._statcast_verbs.get(outcome, {})
 
         if force_type:
             phrase_type = force_type
@@ -1370,7 +1370,7 @@ class NarrativeRenderer(GameRenderer):
                                  simple_verb = self.rng_play.choice(["strikes out looking", "is down on strikes", "goes down looking", "is rung up"])
                                  outcome_text = f"{last_pitch_context}, and {batter_name} {simple_verb} {out_context_str}."
                     else:
-                        verb = self.rng_play.choice(GAME_CONTEXT['statcast_verbs']['Strikeout'][k_type])
+                        verb = self.rng_play.choice(self._strikeout_verbs[k_type])
                         outcome_text = f"{batter_name} {verb} {out_context_str}."
 
             elif outcome == "Walk":
@@ -1,4 +1,3 @@
-from commentary import GAME_CONTEXT
 from gameday import GamedayData
 from .base import GameRenderer
 
@@ -99,8 +98,8 @@ class StatcastRenderer(GameRenderer):
                 result_line = self._format_statcast_template('Error', {'display_outcome': outcome, 'adv_str': "; ".join(advances), 'batter_name': batter_name})
             elif outcome == "Strikeout":
                 k_type = "looking" if play_events[-1]['details']['code'] == 'C' else "swinging"
-                result_line = f"{batter_name} {self.rng_play.choice(GAME_CONTEXT['statcast_verbs']['Strikeout'][k_type])}."
-            elif outcome in GAME_CONTEXT['statcast_verbs'] and outcome not in ['Flyout', 'Groundout']:
+                result_line = f"{batter_name} {self.rng_play.choice(self._strikeout_verbs[k_type])}."
+            elif outcome in self._statcast_verbs and outcome not in ['Flyout', 'Groundout']:
                 cat = self._get_batted_ball_category(outcome, pitch_info.get('ev'), pitch_info.get('la'))
                 phrase, _ = self._get_batted_ball_verb(outcome, cat)
                 direction = self._get_hit_location(outcome, pitch_info.get('ev'), pitch_info.get('la'), pitch_info.get('location'))
@@ -1,9 +1,10 @@
 import unittest
 import random
 import io
+import json
 from copy import deepcopy
 from contextlib import redirect_stdout
-from baseball import BaseballSimulator
+from baseball import BaseballSimulator, JsonPlayWriter, simulate_games
 from renderers import NarrativeRenderer
 from teams import TEAMS
 
@@ -75,5 +76,139 @@ class TestBaseballRealism(unittest.TestCase):
         self.assertGreater(events["Error"], 0, "No errors were recorded in the simulations.")
         self.assertGreater(events["Double Play"], 0, "No double plays were recorded in the simulations.")
 
+    def test_simulate_games_matches_individual_games(self):
+        """Batch simulation should reproduce the same games as running each seed on its own."""
+        home, away = TEAMS["BAY_BOMBERS"], TEAMS["PC_PILOTS"]
+        seeds = [3, 1, 4]
+
+        results = simulate_games(home, away, seeds)
+
+        self.assertEqual(len(results), len(seeds))
+        for seed, gameday_data in zip(seeds, results):
+            game = BaseballSimulator(home, away, game_seed=seed)
+            game.play_game()
+            self.assertEqual(gameday_data, game.gameday_data)
+
+    def test_simulate_games_in_processes_matches_sequential(self):
+        """Spreading games over worker processes should not change any game."""
+        home, away = TEAMS["BAY_BOMBERS"], TEAMS["PC_PILOTS"]
+        seeds = [7, 2, 9, 5]
+
+        self.assertEqual(simulate_games(home, away, seeds, processes=2), simulate_games(home, away, seeds))
+
+    def test_play_sink_receives_plays_instead_of_all_plays(self):
+        """A play sink should see every play in order, leaving allPlays empty."""
+        home, away = TEAMS["BAY_BOMBERS"], TEAMS["PC_PILOTS"]
+        reference = BaseballSimulator(home, away, game_seed=7)
+        reference.play_game()
+
+        streamed = []
+        game = BaseballSimulator(home, away, game_seed=7, play_sink=streamed.append)
+        game.play_game()
+
+        self.assertEqual(streamed, reference.gameday_data['liveData']['plays']['allPlays'])
+        self.assertEqual(game.gameday_data['liveData']['plays']['allPlays'], [])
+        self.assertEqual(game.gameday_data['liveData']['linescore'], reference.gameday_data['liveData']['linescore'])
+
+    def test_edited_arsenal_is_used_by_the_next_game(self):
+        """Pitch tables are rebuilt per game, so an arsenal edited on a copied roster takes effect."""
+        home, away = TEAMS["BAY_BOMBERS"], TEAMS["PC_PILOTS"]
+        BaseballSimulator(home, away, game_seed=1).play_game()
+
+        slider_only = deepcopy(home)
+        for p in slider_only['players']:
+            if 'pitch_arsenal' in p:
+                p['pitch_arsenal'] = {'slider': {'prob': 1.0, 'velo_range': (86, 89), 'spin_range': (2400, 2700)}}
+
+        game = BaseballSimulator(slider_only, away, game_seed=1)
+        game.play_game()
+
+        pitch_types = set()
+        for play in game.gameday_data['liveData']['plays']['allPlays']:
+            if play['about']['isTopInning']:
+                pitch_types.update(e['details']['type']['description'] for e in play['playEvents'] if e.get('isPitch'))
+        self.assertEqual(pitch_types, {'Slider'})
+
+    def test_double_plays_use_the_fielding_teams_rate(self):
+        """Only the side in the field should turn rate-driven double plays, each with its own double_play_rate."""
+        class RateDoublePlaysOnly(BaseballSimulator):
+            # Hard grounders are double plays whatever the rate; make them plain groundouts so every DP is rate-driven
+            def _determine_outcome_from_trajectory(self, ev, la):
+                outcome = super()._determine_outcome_from_trajectory(ev, la)
+                return "Groundout" if outcome == "Double Play" else outcome
+
+        for home_rate, away_rate in ((0.0, 1.0), (1.0, 0.0)):
+            with self.subTest(home_rate=home_rate, away_rate=away_rate):
+                home, away = deepcopy(TEAMS["BAY_BOMBERS"]), deepcopy(TEAMS["PC_PILOTS"])
+                home['double_play_rate'], away['double_play_rate'] = home_rate, away_rate
+
+                # The home team fields in the top half of each inning
+                double_plays = {True: 0, False: 0}
+                for seed in range(5):
+                    game = RateDoublePlaysOnly(home, away, game_seed=seed)
+                    game.play_game()
+                    for play in game.gameday_data['liveData']['plays']['allPlays']:
+                        if play['result']['event'] == "Double Play":
+                            double_plays[play['about']['isTopInning']] += 1
+
+                fielding_rate = {True: home_rate, False: away_rate}
+                for is_top, count in double_plays.items():
+                    if fielding_rate[is_top]:
+                        self.assertGreater(count, 0)
+                    else:
+                        self.assertEqual(count, 0)
+
+    def test_away_double_play_rate_changes_a_seeded_game(self):
+        """A real matchup with unequal rates: giving the away side the home rate must change seed 49's plays."""
+        home, away = TEAMS["BAY_BOMBERS"], TEAMS["DESERT_SCORPIONS"]
+        self.assertNotEqual(home['double_play_rate'], away['double_play_rate'])
+        away_at_home_rate = deepcopy(away)
+        away_at_home_rate['double_play_rate'] = home['double_play_rate']
+
+        game = BaseballSimulator(home, away, game_seed=49)
+        game.play_game()
+        reference = BaseballSimulator(home, away_at_home_rate, game_seed=49)
+        reference.play_game()
+
+        self.assertNotEqual(game.gameday_data['liveData']['plays']['allPlays'],
+                            reference.gameday_data['liveData']['plays']['allPlays'])
+
+    def test_innings_pitched_is_current_after_each_half_inning(self):
+        """Driving a single half-inning should leave the fielding side's inningsPitched in step with its outs."""
+        game = BaseballSimulator(TEAMS["BAY_BOMBERS"], TEAMS["PC_PILOTS"], game_seed=3)
+        game._simulate_half_inning()
+
+        home = game.gameday_data['liveData']['boxscore']['teams']['home']
+        self.assertEqual(home['teamStats']['pitching']['outs'], 3)
+        self.assertEqual(home['teamStats']['pitching']['inningsPitched'], "1.0")
+        for player in home['players'].values():
+            pitching = player['stats']['pitching']
+            self.assertEqual(pitching['inningsPitched'], f"{pitching['outs'] // 3}.{pitching['outs'] % 3}")
+
+    def test_simulation_does_not_mutate_rosters(self):
+        """Derived per-player caches stay off the caller's roster dicts, including the shared TEAMS data."""
+        home, away = TEAMS["BAY_BOMBERS"], TEAMS["PC_PILOTS"]
+        BaseballSimulator(home, away, game_seed=2).play_game()
+        for team in (home, away):
+            for p in team['players']:
+                self.assertEqual([k for k in p if k.startswith('_')], [], p['legal_name'])
+
+    def test_json_play_writer_streams_a_json_array_of_plays(self):
+        """Plays written through JsonPlayWriter should read back as the game's allPlays."""
+        home, away = TEAMS["BAY_BOMBERS"], TEAMS["PC_PILOTS"]
+        reference = BaseballSimulator(home, away, game_seed=7)
+        reference.play_game()
+
+        stream = io.StringIO()
+        writer = JsonPlayWriter(stream, indent=2)
+        BaseballSimulator(home, away, game_seed=7, play_sink=writer).play_game()
+        writer.finalize()
+
+        self.assertEqual(json.loads(stream.getvalue()), reference.gameday_data['liveData']['plays']['allPlays'])
+
+        empty = io.StringIO()
+        JsonPlayWriter(empty).finalize()
+        self.assertEqual(json.loads(empty.getvalue()), [])
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file